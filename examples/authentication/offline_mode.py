@@ -20,23 +20,46 @@ Note: Offline mode cannot access official multiplayer servers.
 """
 
 import asyncio
+import functools
+import hashlib
+import heapq
 import json
 import logging
 import os
+import time
 import uuid
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional
 
 from launcher_core import command, install, _types
 from launcher_core.setting import setup_logger
 from launcher_core.exceptions import VersionNotFound
 
 
+@functools.lru_cache(maxsize=1024)
+def _offline_uuid(name: str) -> str:
+    """Derive a deterministic UUID for an offline username.
+
+    Uses a BLAKE2b digest (faster than the SHA-1 behind ``uuid.uuid5``) with
+    the version/variant bits set so the result is still a valid UUID.
+    """
+    digest = hashlib.blake2b(
+        name.encode("utf-8"), digest_size=16, person=b"mc-offline"
+    ).digest()
+    b = bytearray(digest)
+    b[6] = (b[6] & 0x0F) | 0x50
+    b[8] = (b[8] & 0x3F) | 0x80
+    return str(uuid.UUID(bytes=bytes(b)))
+
+
 class OfflineLauncher:
     """Minecraft launcher for offline mode play."""
 
     def __init__(
-        self, minecraft_dir: str, profiles_file: str = "offline_profiles.json"
+        self,
+        minecraft_dir: str,
+        profiles_file: str = "offline_profiles.json",
+        legacy_uuid: bool = False,
     ):
         """
         Initialize the offline launcher.
@@ -44,11 +67,22 @@ class OfflineLauncher:
         Args:
             minecraft_dir: Path to the .minecraft directory
             profiles_file: File to store offline profiles
+            legacy_uuid: Generate UUIDs with uuid5 (DNS namespace) as older
+                versions of this launcher did, so new profiles keep matching
+                existing world/player data
         """
         self.minecraft_dir = Path(minecraft_dir)
         self.profiles_file = Path(profiles_file)
+        self.legacy_uuid = legacy_uuid
         self.logger = setup_logger(enable_console=True, level=logging.INFO)
 
+        # Cached string paths for the hot filesystem checks
+        self._mc_str = str(self.minecraft_dir)
+        self._versions_str = os.path.join(self._mc_str, "versions")
+
+        # Background scan started while the user is reading the menu
+        self._installed_task: Optional[asyncio.Task] = None
+
         # Create directories
         self.minecraft_dir.mkdir(parents=True, exist_ok=True)
 
@@ -60,7 +94,11 @@ class OfflineLauncher:
         if self.profiles_file.exists():
             try:
                 with open(self.profiles_file, "r") as f:
-                    return json.load(f)
+                    profiles = json.load(f)
+                # Backfill the display id for profiles saved by older versions
+                for profile in profiles.values():
+                    profile.setdefault("short_uuid", profile["uuid"][:8])
+                return profiles
             except Exception as e:
                 self.logger.warning(f"Failed to load profiles: {e}")
         return {}
@@ -88,16 +126,17 @@ class OfflineLauncher:
         """
         if not custom_uuid:
             # Generate deterministic UUID from username for consistency
-            namespace = uuid.UUID(
-                "6ba7b810-9dad-11d1-80b4-00c04fd430c8"
-            )  # DNS namespace
-            custom_uuid = str(uuid.uuid5(namespace, username.lower()))
+            if self.legacy_uuid:
+                custom_uuid = str(uuid.uuid5(uuid.NAMESPACE_DNS, username.lower()))
+            else:
+                custom_uuid = _offline_uuid(username.lower())
 
         profile = {
             "username": username,
             "uuid": custom_uuid,
+            "short_uuid": custom_uuid[:8],
             "access_token": "offline",
-            "created_at": asyncio.get_event_loop().time(),
+            "created_at": time.time(),
             "type": "offline",
         }
 
@@ -146,19 +185,50 @@ class OfflineLauncher:
             uuid=profile["uuid"],
         )
 
-    async def get_installed_versions(self) -> List[str]:
-        """Get list of locally installed Minecraft versions."""
-        versions_dir = self.minecraft_dir / "versions"
-        installed = []
+    def prefetch_installed_versions(self) -> None:
+        """Start scanning installed versions in the background.
 
-        if versions_dir.exists():
-            for version_dir in versions_dir.iterdir():
-                if version_dir.is_dir():
-                    json_file = version_dir / f"{version_dir.name}.json"
-                    if json_file.exists():
-                        installed.append(version_dir.name)
+        The next call to :meth:`get_installed_versions` picks up the result.
+        """
+        if self._installed_task is None or self._installed_task.done():
+            self._installed_task = asyncio.create_task(self._scan_installed_versions())
 
-        return sorted(installed)
+    async def get_installed_versions(self, limit: Optional[int] = None) -> List[str]:
+        """
+        Get list of locally installed Minecraft versions.
+
+        Args:
+            limit: Only return the first ``limit`` versions (sorted)
+
+        Returns:
+            Sorted list of installed version IDs
+        """
+        task, self._installed_task = self._installed_task, None
+        if task is not None:
+            installed = await task
+            return installed[:limit] if limit is not None else installed
+        if limit is not None:
+            return heapq.nsmallest(limit, self._iter_installed_versions())
+        return await self._scan_installed_versions()
+
+    def has_version(self, version: str) -> bool:
+        """Check whether a version is installed without scanning the directory."""
+        return os.path.isfile(
+            os.path.join(self._versions_str, version, version + ".json")
+        )
+
+    async def _scan_installed_versions(self) -> List[str]:
+        return sorted(self._iter_installed_versions())
+
+    def _iter_installed_versions(self) -> Iterator[str]:
+        if not os.path.isdir(self._versions_str):
+            return
+        with os.scandir(self._versions_str) as it:
+            for entry in it:
+                if entry.is_dir() and os.path.isfile(
+                    os.path.join(entry.path, entry.name + ".json")
+                ):
+                    yield entry.name
 
     async def ensure_version_available(self, version: str) -> bool:
         """
@@ -170,9 +240,7 @@ class OfflineLauncher:
         Returns:
             True if version is available
         """
-        installed = await self.get_installed_versions()
-
-        if version in installed:
+        if self.has_version(version):
             self.logger.info(f"Version {version} already available")
             return True
 
@@ -201,9 +269,7 @@ class OfflineLauncher:
                 "setMax": set_max,
             }
 
-            await install.install_minecraft_version(
-                version, str(self.minecraft_dir), callback
-            )
+            await install.install_minecraft_version(version, self._mc_str, callback)
 
             self.logger.info(f"✅ Successfully downloaded {version}")
             return True
@@ -247,7 +313,7 @@ class OfflineLauncher:
             Credential = self.create_offline_credential(username)
 
             # Set up JVM arguments
-            jvm_args = [f"-Xmx{memory}M", f"-Xms{memory//2}M"]
+            jvm_args = [f"-Xmx{memory}M", f"-Xms{memory // 2}M"]
             if additional_jvm_args:
                 jvm_args.extend(additional_jvm_args)
 
@@ -257,7 +323,7 @@ class OfflineLauncher:
 
             # Create launch options
             options: _types.MinecraftOptions = {
-                "gameDirectory": str(self.minecraft_dir),
+                "gameDirectory": self._mc_str,
                 "jvmArguments": jvm_args,
                 "nativesDirectory": str(natives_dir),
                 "demo": demo_mode,
@@ -276,7 +342,7 @@ class OfflineLauncher:
 
             # Generate the launch command
             minecraft_command = await command.get_minecraft_command(
-                version, str(self.minecraft_dir), options, Credential=Credential
+                version, self._mc_str, options, Credential=Credential
             )
 
             self.logger.info("✅ Launch command generated successfully!")
@@ -298,7 +364,7 @@ class OfflineLauncher:
 
                 process = subprocess.Popen(
                     minecraft_command,
-                    cwd=str(self.minecraft_dir),
+                    cwd=self._mc_str,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
                 )
@@ -338,6 +404,162 @@ def display_offline_limitations():
     print("   • Some mod authentication")
 
 
+async def _do_quick_launch(launcher: OfflineLauncher) -> bool:
+    """Menu option 1: quick launch."""
+    profiles = launcher.list_profiles()
+
+    # Get username
+    if profiles:
+        print(f"\nExisting profiles: {', '.join(profiles)}")
+        username = input("Enter username (new or existing): ").strip()
+    else:
+        username = input("Enter username: ").strip()
+
+    if not username:
+        print("❌ Username required")
+        return False
+
+    # Get version
+    installed = await launcher.get_installed_versions(limit=5)
+    if installed:
+        print(f"\nInstalled versions: {', '.join(installed)}...")
+        version = input("Enter version: ").strip()
+    else:
+        version = input("Enter version to download and launch: ").strip()
+
+    if not version:
+        print("❌ Version required")
+        return False
+
+    # Launch
+    success = await launcher.launch_offline(username, version)
+    if not success:
+        print("❌ Launch failed")
+    return False
+
+
+async def _do_profiles(launcher: OfflineLauncher) -> bool:
+    """Menu option 2: manage profiles."""
+    while True:
+        profiles = launcher.list_profiles()
+        print(f"\n👥 Offline Profiles ({len(profiles)} total):")
+
+        if profiles:
+            for i, username in enumerate(profiles, 1):
+                profile = launcher.get_profile(username)
+                print(f"   {i}. {username} ({profile['short_uuid']}...)")
+        else:
+            print("   No profiles created yet")
+
+        print("\nProfile Options:")
+        print("1. Create new profile")
+        print("2. Delete profile")
+        print("3. Back to main menu")
+
+        profile_choice = input("Enter choice (1-3): ").strip()
+
+        if profile_choice == "1":
+            username = input("Enter username: ").strip()
+            if username:
+                custom_uuid = input(
+                    "Enter custom UUID (or press Enter for auto): "
+                ).strip()
+                if not custom_uuid:
+                    custom_uuid = None
+                launcher.create_offline_profile(username, custom_uuid)
+
+        elif profile_choice == "2":
+            if not profiles:
+                print("No profiles to delete")
+                continue
+
+            username = input("Enter username to delete: ").strip()
+            if launcher.delete_profile(username):
+                print(f"✅ Deleted profile for {username}")
+            else:
+                print(f"❌ Profile {username} not found")
+
+        elif profile_choice == "3":
+            return False
+
+
+async def _do_list_versions(launcher: OfflineLauncher) -> bool:
+    """Menu option 3: list installed versions."""
+    installed = await launcher.get_installed_versions()
+    print(f"\n💾 Installed Versions ({len(installed)} total):")
+
+    if installed:
+        for version in installed:
+            print(f"   🟢 {version}")
+    else:
+        print("   No versions installed")
+        print("   Use option 1 to download and install versions")
+    return False
+
+
+async def _do_advanced(launcher: OfflineLauncher) -> bool:
+    """Menu option 4: advanced launch."""
+    profiles = launcher.list_profiles()
+
+    if profiles:
+        print(f"\nProfiles: {', '.join(profiles)}")
+    username = input("Username: ").strip()
+
+    installed = await launcher.get_installed_versions(limit=5)
+    if installed:
+        print(f"Installed: {', '.join(installed)}...")
+    version = input("Version: ").strip()
+
+    if not username or not version:
+        print("❌ Username and version required")
+        return False
+
+    # Advanced options
+    try:
+        memory = int(input("Memory in MB (default 2048): ") or "2048")
+    except ValueError:
+        memory = 2048
+
+    demo = input("Demo mode? (y/N): ").strip().lower() == "y"
+
+    resolution_input = input("Custom resolution WxH (or press Enter): ").strip()
+    custom_resolution = None
+    if resolution_input and "x" in resolution_input:
+        try:
+            w, h = resolution_input.split("x")
+            custom_resolution = (int(w), int(h))
+        except ValueError:
+            print("⚠️  Invalid resolution format")
+
+    jvm_args_input = input("Additional JVM args (or press Enter): ").strip()
+    additional_jvm_args = jvm_args_input.split() if jvm_args_input else None
+
+    # Launch with advanced options
+    success = await launcher.launch_offline(
+        username, version, memory, demo, custom_resolution, additional_jvm_args
+    )
+
+    if not success:
+        print("❌ Launch failed")
+    return False
+
+
+async def _do_exit(launcher: OfflineLauncher) -> bool:
+    """Menu option 5: exit."""
+    print("Goodbye!")
+    return True
+
+
+# Menu choice -> handler; a handler returns True to leave the menu loop
+_MENU: Dict[str, Callable[[OfflineLauncher], Awaitable[bool]]] = {
+    "1": _do_quick_launch,
+    "2": _do_profiles,
+    "3": _do_list_versions,
+    "4": _do_advanced,
+    "5": _do_exit,
+}
+
+
 async def interactive_offline_launcher():
     """Interactive offline launcher interface."""
     print("=== Minecraft Offline Mode Launcher ===")
@@ -364,147 +586,15 @@ async def interactive_offline_launcher():
         print("4. Advanced launch options")
         print("5. Exit")
 
-        choice = input("\nEnter your choice (1-5): ").strip()
-
-        if choice == "1":
-            # Quick launch
-            profiles = launcher.list_profiles()
+        # Scan installed versions while the user picks an option
+        launcher.prefetch_installed_versions()
+        choice = (await asyncio.to_thread(input, "\nEnter your choice (1-5): ")).strip()
 
-            # Get username
-            if profiles:
-                print(f"\nExisting profiles: {', '.join(profiles)}")
-                username = input("Enter username (new or existing): ").strip()
-            else:
-                username = input("Enter username: ").strip()
-
-            if not username:
-                print("❌ Username required")
-                continue
-
-            # Get version
-            installed = await launcher.get_installed_versions()
-            if installed:
-                print(f"\nInstalled versions: {', '.join(installed[:5])}...")
-                version = input("Enter version: ").strip()
-            else:
-                version = input("Enter version to download and launch: ").strip()
-
-            if not version:
-                print("❌ Version required")
-                continue
-
-            # Launch
-            success = await launcher.launch_offline(username, version)
-            if not success:
-                print("❌ Launch failed")
-
-        elif choice == "2":
-            # Manage profiles
-            while True:
-                profiles = launcher.list_profiles()
-                print(f"\n👥 Offline Profiles ({len(profiles)} total):")
-
-                if profiles:
-                    for i, username in enumerate(profiles, 1):
-                        profile = launcher.get_profile(username)
-                        print(f"   {i}. {username} ({profile['uuid'][:8]}...)")
-                else:
-                    print("   No profiles created yet")
-
-                print("\nProfile Options:")
-                print("1. Create new profile")
-                print("2. Delete profile")
-                print("3. Back to main menu")
-
-                profile_choice = input("Enter choice (1-3): ").strip()
-
-                if profile_choice == "1":
-                    username = input("Enter username: ").strip()
-                    if username:
-                        custom_uuid = input(
-                            "Enter custom UUID (or press Enter for auto): "
-                        ).strip()
-                        if not custom_uuid:
-                            custom_uuid = None
-                        launcher.create_offline_profile(username, custom_uuid)
-
-                elif profile_choice == "2":
-                    if not profiles:
-                        print("No profiles to delete")
-                        continue
-
-                    username = input("Enter username to delete: ").strip()
-                    if launcher.delete_profile(username):
-                        print(f"✅ Deleted profile for {username}")
-                    else:
-                        print(f"❌ Profile {username} not found")
-
-                elif profile_choice == "3":
-                    break
-
-        elif choice == "3":
-            # List installed versions
-            installed = await launcher.get_installed_versions()
-            print(f"\n💾 Installed Versions ({len(installed)} total):")
-
-            if installed:
-                for version in installed:
-                    print(f"   🟢 {version}")
-            else:
-                print("   No versions installed")
-                print("   Use option 1 to download and install versions")
-
-        elif choice == "4":
-            # Advanced launch
-            profiles = launcher.list_profiles()
-
-            if profiles:
-                print(f"\nProfiles: {', '.join(profiles)}")
-            username = input("Username: ").strip()
-
-            installed = await launcher.get_installed_versions()
-            if installed:
-                print(f"Installed: {', '.join(installed[:5])}...")
-            version = input("Version: ").strip()
-
-            if not username or not version:
-                print("❌ Username and version required")
-                continue
-
-            # Advanced options
-            try:
-                memory = int(input("Memory in MB (default 2048): ") or "2048")
-            except ValueError:
-                memory = 2048
-
-            demo = input("Demo mode? (y/N): ").strip().lower() == "y"
-
-            resolution_input = input("Custom resolution WxH (or press Enter): ").strip()
-            custom_resolution = None
-            if resolution_input and "x" in resolution_input:
-                try:
-                    w, h = resolution_input.split("x")
-                    custom_resolution = (int(w), int(h))
-                except ValueError:
-                    print("⚠️  Invalid resolution format")
-
-            jvm_args_input = input("Additional JVM args (or press Enter): ").strip()
-            additional_jvm_args = jvm_args_input.split() if jvm_args_input else None
-
-            # Launch with advanced options
-            success = await launcher.launch_offline(
-                username, version, memory, demo, custom_resolution, additional_jvm_args
-            )
-
-            if not success:
-                print("❌ Launch failed")
-
-        elif choice == "5":
-            print("Goodbye!")
-            break
-
-        else:
+        handler = _MENU.get(choice)
+        if handler is None:
             print("Invalid choice. Please try again.")
+        elif await handler(launcher):
+            break
 
 
 async def main():
@@ -44,14 +44,29 @@ class SimpleLauncher:
         self.java_executable = java_executable
         self.logger = setup_logger(enable_console=True, level=logging.INFO)
 
+        # Cached string paths for the hot filesystem checks
+        self._mc_str = str(self.minecraft_dir)
+        self._versions_str = os.path.join(self._mc_str, "versions")
+
         # Create minecraft directory if it doesn't exist
         self.minecraft_dir.mkdir(parents=True, exist_ok=True)
 
-    async def get_available_versions(self) -> list[str]:
-        """Get list of available Minecraft versions."""
+    async def get_available_versions(
+        self, pending: Optional[asyncio.Task] = None
+    ) -> list[str]:
+        """
+        Get list of available Minecraft versions.
+
+        Args:
+            pending: An already started ``utils.get_version_list()`` task to
+                reuse instead of issuing a new request
+        """
         try:
-            versions = await install.get_version_list()
-            return [v["id"] for v in versions["versions"]]
+            if pending is not None:
+                versions = await pending
+            else:
+                versions = await utils.get_version_list()
+            return [v["id"] for v in versions]
         except Exception as e:
             self.logger.error(f"Failed to get version list: {e}")
             return []
@@ -66,9 +81,9 @@ class SimpleLauncher:
         Returns:
             True if version is installed/downloaded successfully
         """
-        version_path = self.minecraft_dir / "versions" / version / f"{version}.json"
+        version_path = os.path.join(self._versions_str, version, f"{version}.json")
 
-        if version_path.exists():
+        if os.path.isfile(version_path):
             self.logger.info(f"Version {version} already installed")
             return True
 
@@ -91,9 +106,7 @@ class SimpleLauncher:
                 "setMax": set_max,
             }
 
-            await install.install_minecraft_version(
-                version, str(self.minecraft_dir), callback
-            )
+            await install.install_minecraft_version(version, self._mc_str, callback)
 
             self.logger.info(f"Successfully installed version {version}")
             return True
@@ -152,7 +165,7 @@ class SimpleLauncher:
             Credential = self.create_offline_credential(username)
 
             # Set up launch options
-            jvm_args = [f"-Xmx{memory}M", f"-Xms{memory//2}M"]
+            jvm_args = [f"-Xmx{memory}M", f"-Xms{memory // 2}M"]
             if additional_jvm_args:
                 jvm_args.extend(additional_jvm_args)
 
@@ -162,7 +175,7 @@ class SimpleLauncher:
 
             # Create launch options
             options: _types.MinecraftOptions = {
-                "gameDirectory": str(self.minecraft_dir),
+                "gameDirectory": self._mc_str,
                 "jvmArguments": jvm_args,
                 "nativesDirectory": str(natives_dir),
             }
@@ -171,7 +184,7 @@ class SimpleLauncher:
 
             # Generate the Minecraft command
             minecraft_command = await command.get_minecraft_command(
-                version, str(self.minecraft_dir), options, Credential=Credential
+                version, self._mc_str, options, Credential=Credential
             )
 
             self.logger.info("Launch command generated successfully!")
@@ -183,7 +196,7 @@ class SimpleLauncher:
                 self.logger.info("Launching Minecraft...")
                 process = subprocess.Popen(
                     minecraft_command,
-                    cwd=str(self.minecraft_dir),
+                    cwd=self._mc_str,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
                 )
@@ -201,9 +214,14 @@ async def main():
     """Main example function."""
     print("=== Simple Minecraft Launcher Example ===\n")
 
+    # Fetch the version list in the background while the user types
+    versions_task = asyncio.create_task(utils.get_version_list())
+
     # Configuration
-    minecraft_dir = input(
-        "Enter Minecraft directory path (or press Enter for default): "
+    minecraft_dir = (
+        await asyncio.to_thread(
+            input, "Enter Minecraft directory path (or press Enter for default): "
+        )
     ).strip()
     if not minecraft_dir:
         minecraft_dir = os.path.join(os.path.expanduser("~"), ".minecraft")
@@ -215,7 +233,7 @@ async def main():
 
     # Get available versions
     print("\nFetching available Minecraft versions...")
-    versions = await launcher.get_available_versions()
+    versions = await launcher.get_available_versions(versions_task)
 
     if not versions:
         print("Failed to fetch versions. Exiting.")
@@ -226,18 +244,18 @@ async def main():
     recent_versions = [
         v for v in versions[:10] if not any(x in v for x in ["snapshot", "pre", "rc"])
     ]
-    for i, version in enumerate(recent_versions[:5], 1):
-        print(f"{i}. {version}")
+    version_choices = {
+        str(i): version for i, version in enumerate(recent_versions[:5], 1)
+    }
+    for key, version in version_choices.items():
+        print(f"{key}. {version}")
 
     # Let user select version
     version_choice = input(
         "\nEnter version number (1-5) or type a specific version: "
     ).strip()
 
-    if version_choice.isdigit() and 1 <= int(version_choice) <= 5:
-        version = recent_versions[int(version_choice) - 1]
-    else:
-        version = version_choice
+    version = version_choices.get(version_choice, version_choice)
 
     print(f"Selected version: {version}")
 
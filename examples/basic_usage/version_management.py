@@ -17,18 +17,54 @@ Requirements:
 """
 
 import asyncio
+import functools
+import itertools
 import json
+from contextlib import aclosing
 import os
 import logging
+import shutil
+import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, Iterable, List, Optional, Union
+
+import aiohttp
 
 from launcher_core import install, _types
 from launcher_core.setting import setup_logger
 from launcher_core.exceptions import VersionNotFound
 
 
+# How long a fetched manifest is reused in-process before revalidating
+MANIFEST_MEMO_TTL = 600
+
+# Minimum seconds between progress redraws during an install
+PROGRESS_INTERVAL = 0.1
+PROGRESS_TEMPLATE = "\rProgress: {}/{} ({:5.1f}%)"
+
+# Default number of versions installed at once by install_many
+INSTALL_CONCURRENCY = 4
+
+
+# Version type -> slot in _ICON; unknown types use the last slot
+_IDX = {"release": 0, "snapshot": 1, "old_beta": 2, "old_alpha": 3}
+_ICON = ("🟢", "🟡", "🔵", "🟣", "⚪")
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_release_time(release_time: str, fmt: str) -> str:
+    """Format a manifest ``releaseTime``; results are cached per timestamp."""
+    if not release_time:
+        return "Unknown"
+    try:
+        dt = datetime.fromisoformat(release_time.replace("Z", "+00:00"))
+    except ValueError:
+        return "Unknown"
+    return dt.strftime(fmt)
+
+
 class VersionManager:
     """Manages Minecraft versions - listing, downloading, and organizing."""
 
@@ -43,48 +79,130 @@ class VersionManager:
         self.versions_dir = self.minecraft_dir / "versions"
         self.logger = setup_logger(enable_console=True, level=logging.INFO)
 
+        # On-disk copy of the manifest, revalidated with its ETag
+        self._manifest_cache_path = self.versions_dir / ".manifest.json"
+        self._manifest_etag_path = self.versions_dir / ".manifest.json.etag"
+
+        # In-process memo: (monotonic fetch time, manifest)
+        self._manifest_memo: Optional[tuple[float, Dict]] = None
+        self._manifest_task: Optional[asyncio.Task] = None
+
+        # Last status reported per version, so concurrent installs only
+        # print each status change once
+        self._install_status: Dict[str, str] = {}
+
         # Create directories if they don't exist
         self.minecraft_dir.mkdir(parents=True, exist_ok=True)
         self.versions_dir.mkdir(parents=True, exist_ok=True)
 
+    def _cached_manifest(self) -> Optional[Dict]:
+        """Return the in-process manifest if it is still fresh."""
+        if self._manifest_memo is None:
+            return None
+        fetched_at, manifest = self._manifest_memo
+        if time.monotonic() - fetched_at > MANIFEST_MEMO_TTL:
+            return None
+        return manifest
+
+    def prefetch(self) -> None:
+        """Start fetching the version manifest in the background."""
+        if self._manifest_task is None:
+            self._manifest_task = asyncio.create_task(self._load_version_manifest())
+
     async def get_version_manifest(self) -> Dict:
         """Get the complete version manifest from Mojang."""
-        try:
-            manifest = await install.get_version_list()
-            self.logger.info(
-                f"Fetched manifest with {len(manifest['versions'])} versions"
-            )
+        manifest = self._cached_manifest()
+        if manifest is not None:
             return manifest
+
+        task, self._manifest_task = self._manifest_task, None
+        if task is not None:
+            return await task
+        return await self._load_version_manifest()
+
+    async def _load_version_manifest(self) -> Dict:
+        try:
+            manifest = await self._fetch_version_manifest()
         except Exception as e:
-            self.logger.error(f"Failed to fetch version manifest: {e}")
+            self.logger.error("Failed to fetch version manifest: %s", e)
             return {"versions": [], "latest": {}}
 
+        self._manifest_memo = (time.monotonic(), manifest)
+        self.logger.info("Fetched manifest with %d versions", len(manifest["versions"]))
+        return manifest
+
+    async def _fetch_version_manifest(self) -> Dict:
+        """Download the manifest, or reuse the disk copy if Mojang answers 304."""
+        etag = None
+        body = None
+        try:
+            etag = self._manifest_etag_path.read_text().strip()
+            body = self._manifest_cache_path.read_bytes()
+        except OSError:
+            etag = None
+
+        headers = {"If-None-Match": etag} if etag else {}
+        async with aiohttp.ClientSession() as session:
+            async with session.get(
+                install.VERSION_MANIFEST_URL, headers=headers
+            ) as response:
+                if response.status == 304 and body is not None:
+                    return json.loads(body)
+                response.raise_for_status()
+                body = await response.read()
+                etag = response.headers.get("ETag")
+
+        manifest = json.loads(body)
+        if etag:
+            self._write_manifest_cache(etag, body)
+        return manifest
+
+    def _write_manifest_cache(self, etag: str, body: bytes) -> None:
+        """Atomically replace the on-disk manifest and its ETag."""
+        try:
+            for path, data in (
+                (self._manifest_cache_path, body),
+                (self._manifest_etag_path, etag.encode()),
+            ):
+                tmp_path = path.with_name(path.name + ".tmp")
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning("Failed to cache version manifest: %s", e)
+
     def filter_versions(
         self,
-        versions: List[Dict],
-        version_type: Optional[str] = None,
+        versions: Iterable[Dict],
+        version_type: Union[str, FrozenSet[str], None] = None,
         limit: Optional[int] = None,
     ) -> List[Dict]:
         """
         Filter versions by type and limit results.
 
+        The input is consumed lazily, so scanning stops after ``limit`` matches.
+
         Args:
-            versions: List of version dictionaries
-            version_type: Filter by type ('release', 'snapshot', 'old_beta', 'old_alpha')
+            versions: Iterable of version dictionaries
+            version_type: Type ('release', 'snapshot', 'old_beta', 'old_alpha')
+                or a frozenset of types to keep
             limit: Maximum number of versions to return
 
         Returns:
             Filtered list of versions
         """
         filtered = versions
-
-        if version_type:
-            filtered = [v for v in filtered if v.get("type") == version_type]
+        # Manifest entries always carry "type"; choose the comparison once,
+        # outside the loop, and index the dict directly.
+        if isinstance(version_type, frozenset):
+            types = version_type
+            filtered = (v for v in versions if v["type"] in types)
+        elif version_type:
+            wanted = sys.intern(version_type)
+            filtered = (v for v in versions if v["type"] == wanted)
 
         if limit:
-            filtered = filtered[:limit]
-
-        return filtered
+            return list(itertools.islice(filtered, limit))
+        return list(filtered)
 
     def format_version_info(self, version: Dict) -> str:
         """Format version information for display."""
@@ -92,24 +210,8 @@ class VersionManager:
         version_type = version.get("type", "unknown")
         release_time = version.get("releaseTime", "")
 
-        # Parse and format release time
-        try:
-            if release_time:
-                dt = datetime.fromisoformat(release_time.replace("Z", "+00:00"))
-                formatted_time = dt.strftime("%Y-%m-%d")
-            else:
-                formatted_time = "Unknown"
-        except:
-            formatted_time = "Unknown"
-
-        # Create type indicator
-        type_indicators = {
-            "release": "🟢",
-            "snapshot": "🟡",
-            "old_beta": "🔵",
-            "old_alpha": "🟣",
-        }
-        indicator = type_indicators.get(version_type, "⚪")
+        formatted_time = _format_release_time(release_time, "%Y-%m-%d")
+        indicator = _ICON[_IDX.get(version_type, 4)]
 
         return f"{indicator} {version_id:<15} [{version_type:<8}] ({formatted_time})"
 
@@ -126,18 +228,31 @@ class VersionManager:
         Returns:
             List of version dictionaries
         """
-        manifest = await self.get_version_manifest()
-        versions = manifest.get("versions", [])
-
-        # Filter versions
-        filtered_versions = self.filter_versions(versions, version_type, limit)
+        filtered_versions = []
+        manifest = self._cached_manifest()
+        if manifest is None and self._manifest_task is not None:
+            manifest = await self.get_version_manifest()
+        if manifest is not None:
+            filtered_versions = self.filter_versions(
+                manifest["versions"], version_type, limit
+            )
+        else:
+            # Stream the manifest so we stop parsing once ``limit`` matches are found
+            try:
+                async with aclosing(install.iter_version_list()) as versions:
+                    async for version in versions:
+                        if version_type and version["type"] != version_type:
+                            continue
+                        filtered_versions.append(version)
+                        if len(filtered_versions) == limit:
+                            break
+            except Exception as e:
+                self.logger.error("Failed to fetch version manifest: %s", e)
 
         print(f"\n📋 Available Minecraft Versions:")
         if version_type:
             print(f"   Filtered by type: {version_type}")
-        print(
-            f"   Showing {len(filtered_versions)} of {len(versions)} total versions\n"
-        )
+        print(f"   Showing {len(filtered_versions)} newest versions\n")
 
         for version in filtered_versions:
             print(f"   {self.format_version_info(version)}")
@@ -146,18 +261,16 @@ class VersionManager:
 
     def get_installed_versions(self) -> List[str]:
         """Get list of locally installed versions."""
-        installed = []
-
-        if not self.versions_dir.exists():
-            return installed
-
-        for version_dir in self.versions_dir.iterdir():
-            if version_dir.is_dir():
-                json_file = version_dir / f"{version_dir.name}.json"
-                if json_file.exists():
-                    installed.append(version_dir.name)
-
-        return sorted(installed)
+        try:
+            with os.scandir(self.versions_dir) as it:
+                return sorted(
+                    entry.name
+                    for entry in it
+                    if entry.is_dir()
+                    and os.path.exists(os.path.join(entry.path, entry.name + ".json"))
+                )
+        except FileNotFoundError:
+            return []
 
     async def get_version_details(self, version_id: str) -> Optional[Dict]:
         """
@@ -173,10 +286,10 @@ class VersionManager:
             details = await install.get_version_info(version_id)
             return details
         except VersionNotFound:
-            self.logger.error(f"Version {version_id} not found")
+            self.logger.error("Version %s not found", version_id)
             return None
         except Exception as e:
-            self.logger.error(f"Failed to get version details for {version_id}: {e}")
+            self.logger.error("Failed to get version details for %s: %s", version_id, e)
             return None
 
     def display_version_details(self, details: Dict) -> None:
@@ -187,14 +300,7 @@ class VersionManager:
         main_class = details.get("mainClass", "Unknown")
 
         # Format release time
-        try:
-            if release_time:
-                dt = datetime.fromisoformat(release_time.replace("Z", "+00:00"))
-                formatted_time = dt.strftime("%Y-%m-%d %H:%M:%S UTC")
-            else:
-                formatted_time = "Unknown"
-        except:
-            formatted_time = "Unknown"
+        formatted_time = _format_release_time(release_time, "%Y-%m-%d %H:%M:%S UTC")
 
         # Count libraries
         libraries = details.get("libraries", [])
@@ -219,12 +325,16 @@ class VersionManager:
                 f"   Assets: {assets.get('id', 'Unknown')} ({assets.get('totalSize', 0)} bytes)"
             )
 
-    async def install_version(self, version_id: str) -> bool:
+    async def install_version(
+        self, version_id: str, show_progress: bool = True
+    ) -> bool:
         """
         Install a specific Minecraft version.
 
         Args:
             version_id: Version to install
+            show_progress: Redraw a progress line; disable when several
+                installs share the terminal
 
         Returns:
             True if installation successful
@@ -232,28 +342,42 @@ class VersionManager:
         try:
             # Check if already installed
             if version_id in self.get_installed_versions():
-                self.logger.info(f"Version {version_id} already installed")
+                self.logger.info("Version %s already installed", version_id)
                 return True
 
-            self.logger.info(f"Installing Minecraft {version_id}...")
+            self.logger.info("Installing Minecraft %s...", version_id)
 
-            # Create progress callbacks
-            current_status = {"status": "", "progress": 0, "max": 0}
+            # Create progress callbacks; progress is redrawn on one line at
+            # most every PROGRESS_INTERVAL seconds
+            max_val = 0
+            last_emit = 0.0
 
             def set_status(status: str) -> None:
-                current_status["status"] = status
-                print(f"Status: {status}")
+                if self._install_status.get(version_id) == status:
+                    return
+                self._install_status[version_id] = status
+                print(f"\n[{version_id}] Status: {status}")
 
             def set_progress(progress: int) -> None:
-                current_status["progress"] = progress
-                max_val = current_status["max"]
-                if max_val > 0:
-                    percentage = (progress / max_val) * 100
-                    print(f"Progress: {progress}/{max_val} ({percentage:.1f}%)")
+                nonlocal last_emit
+                if not show_progress or max_val <= 0:
+                    return
+                now = time.monotonic()
+                if now - last_emit < PROGRESS_INTERVAL and progress != max_val:
+                    return
+                last_emit = now
+                sys.stdout.write(
+                    PROGRESS_TEMPLATE.format(
+                        progress, max_val, progress / max_val * 100
+                    )
+                )
+                sys.stdout.flush()
 
             def set_max(maximum: int) -> None:
-                current_status["max"] = maximum
-                print(f"Total items: {maximum}")
+                nonlocal max_val
+                max_val = maximum
+                if show_progress:
+                    print(f"\nTotal items: {maximum}")
 
             callback: _types.CallbackDict = {
                 "setStatus": set_status,
@@ -266,17 +390,44 @@ class VersionManager:
                 version_id, str(self.minecraft_dir), callback
             )
 
-            self.logger.info(f"✅ Successfully installed {version_id}")
+            self.logger.info("✅ Successfully installed %s", version_id)
             return True
 
         except VersionNotFound:
-            self.logger.error(f"❌ Version {version_id} not found")
+            self.logger.error("❌ Version %s not found", version_id)
             return False
         except Exception as e:
-            self.logger.error(f"❌ Failed to install {version_id}: {e}")
+            self.logger.error("❌ Failed to install %s: %s", version_id, e)
             return False
+        finally:
+            self._install_status.pop(version_id, None)
+
+    async def install_many(
+        self, version_ids: Iterable[str], concurrency: int = INSTALL_CONCURRENCY
+    ) -> Dict[str, bool]:
+        """
+        Install several versions concurrently.
+
+        Args:
+            version_ids: Versions to install; duplicates are installed once
+            concurrency: Maximum number of installs running at the same time
 
-    def uninstall_version(self, version_id: str) -> bool:
+        Returns:
+            Mapping of version ID to whether its installation succeeded
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def install_one(version_id: str) -> bool:
+            async with semaphore:
+                return await self.install_version(version_id, show_progress=False)
+
+        ids = list(dict.fromkeys(version_ids))
+        results = await asyncio.gather(
+            *(install_one(version_id) for version_id in ids), return_exceptions=True
+        )
+        return {version_id: result is True for version_id, result in zip(ids, results)}
+
+    async def uninstall_version(self, version_id: str) -> bool:
         """
         Uninstall a locally installed version.
 
@@ -289,17 +440,16 @@ class VersionManager:
         version_path = self.versions_dir / version_id
 
         if not version_path.exists():
-            self.logger.warning(f"Version {version_id} not found locally")
+            self.logger.warning("Version %s not found locally", version_id)
             return False
 
         try:
-            import shutil
-
-            shutil.rmtree(version_path)
-            self.logger.info(f"✅ Successfully uninstalled {version_id}")
+            # Deleting can take seconds; keep the event loop free meanwhile
+            await asyncio.to_thread(shutil.rmtree, version_path)
+            self.logger.info("✅ Successfully uninstalled %s", version_id)
             return True
         except Exception as e:
-            self.logger.error(f"❌ Failed to uninstall {version_id}: {e}")
+            self.logger.error("❌ Failed to uninstall %s: %s", version_id, e)
             return False
 
 
@@ -308,8 +458,10 @@ async def interactive_version_manager():
     print("=== Minecraft Version Manager ===\n")
 
     # Get Minecraft directory
-    minecraft_dir = input(
-        "Enter Minecraft directory (or press Enter for default): "
+    minecraft_dir = (
+        await asyncio.to_thread(
+            input, "Enter Minecraft directory (or press Enter for default): "
+        )
     ).strip()
     if not minecraft_dir:
         minecraft_dir = os.path.join(os.path.expanduser("~"), ".minecraft")
@@ -318,6 +470,7 @@ async def interactive_version_manager():
 
     # Create version manager
     vm = VersionManager(minecraft_dir)
+    vm.prefetch()
 
     while True:
         print("\n" + "=" * 50)
@@ -327,14 +480,18 @@ async def interactive_version_manager():
         print("3. Get version details")
         print("4. Install version")
         print("5. Uninstall version")
-        print("6. Exit")
+        print("6. Install multiple versions")
+        print("7. Exit")
 
-        choice = input("\nEnter your choice (1-6): ").strip()
+        choice = (await asyncio.to_thread(input, "\nEnter your choice (1-7): ")).strip()
 
         if choice == "1":
             # List available versions
-            type_filter = input(
-                "Filter by type (release/snapshot/old_beta/old_alpha) or press Enter for all: "
+            type_filter = (
+                await asyncio.to_thread(
+                    input,
+                    "Filter by type (release/snapshot/old_beta/old_alpha) or press Enter for all: ",
+                )
             ).strip()
             if type_filter and type_filter not in [
                 "release",
@@ -344,7 +501,11 @@ async def interactive_version_manager():
             ]:
                 type_filter = None
 
-            limit_input = input("Maximum versions to show (default 20): ").strip()
+            limit_input = (
+                await asyncio.to_thread(
+                    input, "Maximum versions to show (default 20): "
+                )
+            ).strip()
             try:
                 limit = int(limit_input) if limit_input else 20
             except ValueError:
@@ -364,7 +525,7 @@ async def interactive_version_manager():
 
         elif choice == "3":
             # Get version details
-            version_id = input("Enter version ID: ").strip()
+            version_id = (await asyncio.to_thread(input, "Enter version ID: ")).strip()
             if version_id:
                 details = await vm.get_version_details(version_id)
                 if details:
@@ -374,7 +535,9 @@ async def interactive_version_manager():
 
         elif choice == "4":
             # Install version
-            version_id = input("Enter version ID to install: ").strip()
+            version_id = (
+                await asyncio.to_thread(input, "Enter version ID to install: ")
+            ).strip()
             if version_id:
                 print(f"\nInstalling {version_id}...")
                 success = await vm.install_version(version_id)
@@ -392,7 +555,11 @@ async def interactive_version_manager():
             for i, version in enumerate(installed, 1):
                 print(f"{i}. {version}")
 
-            choice_input = input("Enter version number or ID to uninstall: ").strip()
+            choice_input = (
+                await asyncio.to_thread(
+                    input, "Enter version number or ID to uninstall: "
+                )
+            ).strip()
 
             if choice_input.isdigit() and 1 <= int(choice_input) <= len(installed):
                 version_id = installed[int(choice_input) - 1]
@@ -401,14 +568,32 @@ async def interactive_version_manager():
 
             if version_id in installed:
                 confirm = (
-                    input(f"Really uninstall {version_id}? (y/N): ").strip().lower()
-                )
+                    (
+                        await asyncio.to_thread(
+                            input, f"Really uninstall {version_id}? (y/N): "
+                        )
+                    ).strip()
+                ).lower()
                 if confirm == "y":
-                    vm.uninstall_version(version_id)
+                    await vm.uninstall_version(version_id)
             else:
                 print("Invalid version selection")
 
         elif choice == "6":
+            # Install several versions at once
+            ids_input = (
+                await asyncio.to_thread(
+                    input, "Enter version IDs to install (comma separated): "
+                )
+            ).strip()
+            version_ids = [v.strip() for v in ids_input.split(",") if v.strip()]
+            if version_ids:
+                print(f"\nInstalling {len(version_ids)} versions...")
+                results = await vm.install_many(version_ids)
+                for version_id, success in results.items():
+                    print(f"   {'✅' if success else '❌'} {version_id}")
+
+        elif choice == "7":
             print("Goodbye!")
             break
 
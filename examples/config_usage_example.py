@@ -6,6 +6,7 @@
 import asyncio
 import os
 from pathlib import Path
+from typing import Optional
 
 # 從配置模組導入必要的類
 from launcher_core.config.load_launcher_config import ConfigManager, LauncherConfig
@@ -72,12 +73,13 @@ async def environment_variable_example():
     os.environ["MC_LAUNCHER_LOG_LEVEL"] = "WARNING"
     os.environ["MC_LAUNCHER_MINECRAFT_OPTIONS__USERNAME"] = "EnvPlayer"
 
-    # 創建配置（環境變量會自動覆蓋默認值）
-    config = LauncherConfig()
+    # 創建配置（一次掃描 MC_LAUNCHER_ 前綴的環境變量覆蓋默認值）
+    config = LauncherConfig.from_env()
 
     print(f"從環境變量加載的啟動器名稱: {config.launcher_name}")
     print(f"從環境變量加載的並發下載數: {config.concurrent_downloads}")
     print(f"從環境變量加載的日誌級別: {config.log_level}")
+    print(f"從環境變量加載的用戶名: {config.minecraft_options.username}")
 
     # 清理環境變量
     for key in [
@@ -112,7 +114,8 @@ async def advanced_config_management():
         "proxy_port": 8080,
     }
 
-    config = await config_manager.update_config(**updates)
+    # 先只更新內存，等 Minecraft 選項一起寫入文件
+    config = await config_manager.update_config(flush=False, **updates)
 
     # 3. 創建複雜的 Minecraft 選項
     minecraft_opts = MinecraftOptions(
@@ -134,7 +137,7 @@ async def advanced_config_management():
         port="25565",
     )
 
-    # 4. 更新 Minecraft 選項
+    # 4. 更新 Minecraft 選項，所有更新一次性寫入文件
     await config_manager.update_config(minecraft_options=minecraft_opts)
 
     print("✅ 高級配置設置完成")
@@ -158,6 +161,8 @@ class LauncherApplication:
     def __init__(self, config_path: str = "app_config.toml"):
         self.config_manager = ConfigManager(config_path)
         self.config: LauncherConfig = None
+        # get_launch_options 的緩存，配置更新時清空
+        self._launch_opts_cache: Optional[dict] = None
 
     async def initialize(self):
         """初始化應用程式"""
@@ -165,6 +170,7 @@ class LauncherApplication:
 
         # 加載配置
         self.config = await self.config_manager.load_config()
+        self._launch_opts_cache = None
 
         # 確保必要的目錄存在
         if self.config.config_directory:
@@ -193,17 +199,23 @@ class LauncherApplication:
             launcherVersion=self.config.launcher_version,
         )
 
-        await self.config_manager.update_config(minecraft_options=minecraft_opts)
-        self.config = await self.config_manager.load_config(reload=True)
+        self.config = await self.config_manager.update_config(
+            minecraft_options=minecraft_opts
+        )
+        self._launch_opts_cache = None
 
         print(f"✅ Minecraft 設定檔已更新: {username} -> {game_dir}")
 
     def get_launch_options(self) -> dict:
-        """獲取啟動選項"""
+        """獲取啟動選項（緩存結果，請勿直接修改返回的字典）"""
         if not self.config.minecraft_options:
             return {}
 
-        return self.config.minecraft_options.model_dump(exclude_none=True)
+        if self._launch_opts_cache is None:
+            self._launch_opts_cache = self.config.minecraft_options.model_dump(
+                exclude_none=True
+            )
+        return self._launch_opts_cache
 
 
 async def application_example():
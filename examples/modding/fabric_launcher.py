@@ -24,16 +24,83 @@ Fabric is known for:
 """
 
 import asyncio
-import json
+import functools
+import itertools
 import logging
 import os
+import re
+import subprocess
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+from uuid import uuid4
 
-from launcher_core import fabric, install, command, _types
+import aiohttp
+
+from launcher_core import fabric, command, _types
+from launcher_core._helper import json_loads
 from launcher_core.setting import setup_logger
 from launcher_core.exceptions import VersionNotFound, UnsupportedVersion
 
+# How long Fabric meta results are reused before asking the server again
+METADATA_TTL = 600
+
+# Fabric-optimized JVM arguments added after the memory settings
+FABRIC_JVM_ARGS: Tuple[str, ...] = (
+    "-XX:+UnlockExperimentalVMOptions",
+    "-XX:+UseG1GC",
+    "-XX:G1NewSizePercent=20",
+    "-XX:G1ReservePercent=20",
+    "-XX:MaxGCPauseMillis=50",
+    "-XX:G1HeapRegionSize=16M",
+)
+
+# Case-insensitive "fabric" check for version directory names
+_FABRIC_RE = re.compile(r"fabric", re.IGNORECASE)
+
+# Version directories created by the Fabric installer:
+# fabric-loader-<loader version>-<minecraft version>
+_FABRIC_VERSION_RE = re.compile(r"fabric-loader-[^-]+-(?P<mc>.+)")
+
+
+@functools.lru_cache(maxsize=64)
+def _load_version_json(path: str, mtime_ns: int) -> Dict:
+    """Parse a version JSON; the mtime in the key drops stale entries on change."""
+    with open(path, "rb") as f:
+        return json_loads(f.read())
+
+
+def _ttl_cached(method):
+    """
+    Cache a metadata method's result per argument tuple for METADATA_TTL seconds.
+
+    Failed lookups (empty lists, None) are not cached so they are retried.
+    Concurrent calls with the same arguments share one in-flight request.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        entry = self._metadata_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        task = self._metadata_pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(method(self, *args, **kwargs))
+            self._metadata_pending[key] = task
+            task.add_done_callback(lambda _: self._metadata_pending.pop(key, None))
+
+        value = await asyncio.shield(task)
+        if isinstance(value, list):
+            # Cached results are shared between callers, so keep them immutable
+            value = tuple(value)
+        if value:
+            self._metadata_cache[key] = (time.monotonic() + METADATA_TTL, value)
+        return value
+
+    return wrapper
+
 
 class FabricLauncher:
     """Minecraft launcher with Fabric mod loader support."""
@@ -46,15 +113,68 @@ class FabricLauncher:
             minecraft_dir: Path to the .minecraft directory
         """
         self.minecraft_dir = Path(minecraft_dir)
+        # String form for os.path joins and API calls in hot paths
+        self._mc_dir_str = str(self.minecraft_dir)
+        self._versions_dir_str = os.path.join(self._mc_dir_str, "versions")
+        self._mods_dir_str = os.path.join(self._mc_dir_str, "mods")
         self.logger = setup_logger(enable_console=True, level=logging.INFO)
 
+        # (method name, args, kwargs) -> (expiry, value); see _ttl_cached
+        self._metadata_cache: Dict[tuple, tuple] = {}
+        self._metadata_pending: Dict[tuple, asyncio.Future] = {}
+        self._prefetch: Optional[asyncio.Future] = None
+
+        # Every Minecraft version Fabric supports, once the full list is fetched
+        self._supported_set: Optional[FrozenSet[str]] = None
+
+        # Minecraft version -> installed Fabric version name; None until built
+        self._installed_index: Optional[Dict[str, str]] = None
+        # (versions/ mtime_ns, installed Fabric version names)
+        self._installed_cache: Optional[tuple] = None
+
+        # One pooled session for all Fabric meta requests, so repeated menu
+        # actions reuse open connections instead of new TLS handshakes
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=16, limit_per_host=8, keepalive_timeout=75, ttl_dns_cache=300
+            )
+        )
+
         # Create necessary directories
         self.minecraft_dir.mkdir(parents=True, exist_ok=True)
         (self.minecraft_dir / "mods").mkdir(exist_ok=True)
 
+    def warm_up(self) -> None:
+        """
+        Start fetching the metadata the menu shows first in the background.
+
+        The results land in the TTL cache, so the first menu visit is usually
+        answered without waiting on the network.
+        """
+        if self._prefetch is None:
+            self._prefetch = asyncio.gather(
+                self.get_supported_minecraft_versions(True),
+                self.get_supported_minecraft_versions(False),
+                self.get_fabric_loader_versions(),
+                self.get_latest_fabric_loader(),
+                return_exceptions=True,
+            )
+
+    async def aclose(self) -> None:
+        """Cancel pending prefetches and close the shared HTTP session."""
+        if self._prefetch is not None and not self._prefetch.done():
+            self._prefetch.cancel()
+        # Shielded metadata fetches outlive the prefetch cancel, so stop them too
+        pending = list(self._metadata_pending.values())
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        await self._session.close()
+
+    @_ttl_cached
     async def get_supported_minecraft_versions(
         self, stable_only: bool = True
-    ) -> List[str]:
+    ) -> Sequence[str]:
         """
         Get Minecraft versions supported by Fabric.
 
@@ -62,20 +182,27 @@ class FabricLauncher:
             stable_only: Return only stable versions
 
         Returns:
-            List of supported Minecraft versions
+            Tuple of supported Minecraft versions
         """
         try:
             if stable_only:
-                versions = await fabric.get_stable_minecraft_versions()
+                versions = await fabric.get_stable_minecraft_versions(
+                    session=self._session
+                )
                 self.logger.info(
                     f"Found {len(versions)} stable Minecraft versions for Fabric"
                 )
             else:
-                all_versions = await fabric.get_all_minecraft_versions()
+                all_versions = await fabric.get_all_minecraft_versions(
+                    session=self._session
+                )
                 versions = [v["version"] for v in all_versions]
                 self.logger.info(
                     f"Found {len(versions)} total Minecraft versions for Fabric"
                 )
+                if versions:
+                    # The full list answers later is_minecraft_version_supported calls
+                    self._supported_set = frozenset(versions)
 
             return versions
 
@@ -83,15 +210,20 @@ class FabricLauncher:
             self.logger.error(f"Failed to fetch supported Minecraft versions: {e}")
             return []
 
+    @_ttl_cached
     async def get_latest_minecraft_version(
         self, stable_only: bool = True
     ) -> Optional[str]:
         """Get the latest Minecraft version supported by Fabric."""
         try:
             if stable_only:
-                version = await fabric.get_latest_stable_minecraft_version()
+                version = await fabric.get_latest_stable_minecraft_version(
+                    session=self._session
+                )
             else:
-                version = await fabric.get_latest_minecraft_version()
+                version = await fabric.get_latest_minecraft_version(
+                    session=self._session
+                )
 
             self.logger.info(
                 f"Latest {'stable ' if stable_only else ''}Minecraft version: {version}"
@@ -105,27 +237,41 @@ class FabricLauncher:
     async def is_minecraft_version_supported(self, version: str) -> bool:
         """Check if a Minecraft version is supported by Fabric."""
         try:
-            supported = await fabric.is_minecraft_version_supported(version)
+            if self._supported_set is not None:
+                supported = version in self._supported_set
+            else:
+                supported = await fabric.is_minecraft_version_supported(
+                    version, session=self._session
+                )
             self.logger.info(f"Minecraft {version} Fabric support: {supported}")
             return supported
         except Exception as e:
             self.logger.error(f"Failed to check version support: {e}")
             return False
 
-    async def get_fabric_loader_versions(self) -> List[Dict]:
+    def _invalidate(self, *method_names: str) -> None:
+        """Drop cached metadata for the given methods."""
+        for key in [k for k in self._metadata_cache if k[0] in method_names]:
+            del self._metadata_cache[key]
+
+    @_ttl_cached
+    async def get_fabric_loader_versions(self) -> Sequence[Dict]:
         """Get available Fabric loader versions."""
         try:
-            loaders = await fabric.get_all_loader_versions()
+            loaders = await fabric.get_all_loader_versions(session=self._session)
             self.logger.info(f"Found {len(loaders)} Fabric loader versions")
             return loaders
         except Exception as e:
             self.logger.error(f"Failed to fetch Fabric loader versions: {e}")
             return []
 
+    @_ttl_cached
     async def get_latest_fabric_loader(self) -> Optional[str]:
         """Get the latest Fabric loader version."""
         try:
-            loader_version = await fabric.get_latest_loader_version()
+            loader_version = await fabric.get_latest_loader_version(
+                session=self._session
+            )
             self.logger.info(f"Latest Fabric loader: {loader_version}")
             return loader_version
         except Exception as e:
@@ -146,33 +292,55 @@ class FabricLauncher:
             True if installation successful
         """
         try:
-            # Check if Minecraft version is supported
-            if not await self.is_minecraft_version_supported(minecraft_version):
+            # Check version support and, if needed, look up the latest loader
+            # at the same time; the two requests are independent
+            if loader_version:
+                supported = await self.is_minecraft_version_supported(minecraft_version)
+            else:
+                supported, loader_version = await asyncio.gather(
+                    self.is_minecraft_version_supported(minecraft_version),
+                    self.get_latest_fabric_loader(),
+                    return_exceptions=True,
+                )
+
+            if supported is not True:
                 self.logger.error(
                     f"Minecraft {minecraft_version} is not supported by Fabric"
                 )
                 return False
 
-            # Use latest loader if none specified
-            if not loader_version:
-                loader_version = await self.get_latest_fabric_loader()
-                if not loader_version:
-                    self.logger.error("Failed to get Fabric loader version")
-                    return False
+            if not isinstance(loader_version, str) or not loader_version:
+                self.logger.error("Failed to get Fabric loader version")
+                return False
 
             self.logger.info(
                 f"Installing Fabric {loader_version} for Minecraft {minecraft_version}..."
             )
 
-            # Create progress callbacks
+            # Create progress callbacks; progress is logged once per percent
+            # step rather than on every tick
+            max_val = 0
+            last_pct = -1
+
             def set_status(status: str) -> None:
-                self.logger.info(f"Status: {status}")
+                self.logger.info("Status: %s", status)
 
             def set_progress(progress: int) -> None:
-                self.logger.info(f"Progress: {progress}")
+                nonlocal last_pct
+                if max_val <= 0:
+                    return
+                pct = progress * 100 // max_val
+                if pct <= last_pct:
+                    return
+                last_pct = pct
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("Progress: %d/%d (%d%%)", progress, max_val, pct)
 
             def set_max(maximum: int) -> None:
-                self.logger.info(f"Total: {maximum}")
+                nonlocal max_val, last_pct
+                max_val = maximum
+                last_pct = -1
+                self.logger.info("Total: %d", maximum)
 
             callback: _types.CallbackDict = {
                 "setStatus": set_status,
@@ -183,7 +351,7 @@ class FabricLauncher:
             # Install Fabric
             await fabric.install_fabric(
                 minecraft_version,
-                str(self.minecraft_dir),
+                self._mc_dir_str,
                 loader_version=loader_version,
                 callback=callback,
             )
@@ -191,6 +359,9 @@ class FabricLauncher:
             self.logger.info(
                 f"✅ Successfully installed Fabric {loader_version} for Minecraft {minecraft_version}"
             )
+            self._invalidate("get_fabric_loader_versions", "get_latest_fabric_loader")
+            self._installed_index = None
+            self._installed_cache = None
             return True
 
         except VersionNotFound:
@@ -207,28 +378,76 @@ class FabricLauncher:
 
     async def get_installed_fabric_versions(self) -> List[str]:
         """Get list of installed Fabric versions."""
-        installed = []
-        versions_dir = self.minecraft_dir / "versions"
+        versions_dir = self._versions_dir_str
+        try:
+            mtime_ns = os.stat(versions_dir).st_mtime_ns
+        except FileNotFoundError:
+            return []
 
-        if not versions_dir.exists():
-            return installed
+        # Adding or removing a version directory changes the mtime of
+        # versions/, so an unchanged mtime means the listing is still valid
+        cached = self._installed_cache
+        if cached is not None and cached[0] == mtime_ns:
+            return list(cached[1])
 
-        for version_dir in versions_dir.iterdir():
-            if version_dir.is_dir():
-                version_name = version_dir.name
-                # Check if it's a Fabric version
-                if "fabric" in version_name.lower():
-                    json_file = version_dir / f"{version_name}.json"
-                    if json_file.exists():
-                        installed.append(version_name)
+        installed = []
+        with os.scandir(versions_dir) as it:
+            for entry in it:
+                # Check if it's a Fabric version with its version JSON
+                if (
+                    _FABRIC_RE.search(entry.name) is not None
+                    and entry.is_dir()
+                    and os.path.exists(os.path.join(entry.path, f"{entry.name}.json"))
+                ):
+                    installed.append(entry.name)
+
+        installed.sort()
+        self._installed_cache = (mtime_ns, tuple(installed))
+        return installed
+
+    def load_version_json(self, version_name: str) -> Optional[Dict]:
+        """
+        Load an installed version's JSON, reusing the parsed result until the
+        file changes.
 
-        return sorted(installed)
+        Args:
+            version_name: Name of the version directory
+
+        Returns:
+            Parsed version JSON or None if it does not exist
+        """
+        path = os.path.join(
+            self._versions_dir_str, version_name, f"{version_name}.json"
+        )
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        return _load_version_json(path, mtime_ns)
+
+    async def _refresh_installed_index(self) -> Dict[str, str]:
+        """Rebuild the Minecraft version -> installed Fabric version index."""
+        index: Dict[str, str] = {}
+        for name in await self.get_installed_fabric_versions():
+            match = _FABRIC_VERSION_RE.fullmatch(name)
+            if match:
+                # Names are sorted, so the first loader per version wins
+                index.setdefault(match["mc"], name)
+        self._installed_index = index
+        return index
+
+    async def find_installed_fabric_version(
+        self, minecraft_version: str
+    ) -> Optional[str]:
+        """Return the installed Fabric version name for a Minecraft version."""
+        index = self._installed_index
+        if index is None:
+            index = await self._refresh_installed_index()
+        return index.get(minecraft_version)
 
     def create_offline_credential(self, username: str = "Player") -> _types.Credential:
         """Create offline Credential for testing."""
-        import uuid
-
-        fake_uuid = str(uuid.uuid4())
+        fake_uuid = str(uuid4())
 
         return _types.Credential(
             access_token="offline", username=username, uuid=fake_uuid
@@ -259,34 +478,28 @@ class FabricLauncher:
         """
         try:
             # Check if Fabric is installed for this version
-            installed_versions = await self.get_installed_fabric_versions()
-
-            # Find matching installed version
-            fabric_version_name = None
-            for installed in installed_versions:
-                if minecraft_version in installed and "fabric" in installed.lower():
-                    fabric_version_name = installed
-                    break
+            fabric_version_name = await self.find_installed_fabric_version(
+                minecraft_version
+            )
 
             if not fabric_version_name:
                 self.logger.warning(
                     f"Fabric not installed for Minecraft {minecraft_version}"
                 )
-                install_choice = input("Install Fabric now? (Y/n): ").strip().lower()
+                install_choice = (
+                    (await asyncio.to_thread(input, "Install Fabric now? (Y/n): "))
+                    .strip()
+                    .lower()
+                )
 
                 if install_choice != "n":
                     if not await self.install_fabric(minecraft_version, loader_version):
                         return False
 
                     # Find the newly installed version
-                    updated_versions = await self.get_installed_fabric_versions()
-                    for installed in updated_versions:
-                        if (
-                            minecraft_version in installed
-                            and "fabric" in installed.lower()
-                        ):
-                            fabric_version_name = installed
-                            break
+                    fabric_version_name = await self.find_installed_fabric_version(
+                        minecraft_version
+                    )
                 else:
                     return False
 
@@ -299,32 +512,22 @@ class FabricLauncher:
                 Credential = self.create_offline_credential(username)
 
             # Set up JVM arguments (Fabric is lighter than Forge)
-            jvm_args = [f"-Xmx{memory}M", f"-Xms{memory//2}M"]
-
-            # Add Fabric-optimized JVM arguments
-            jvm_args.extend(
-                [
-                    "-XX:+UnlockExperimentalVMOptions",
-                    "-XX:+UseG1GC",
-                    "-XX:G1NewSizePercent=20",
-                    "-XX:G1ReservePercent=20",
-                    "-XX:MaxGCPauseMillis=50",
-                    "-XX:G1HeapRegionSize=16M",
-                ]
-            )
-
-            if additional_jvm_args:
-                jvm_args.extend(additional_jvm_args)
+            jvm_args = [
+                f"-Xmx{memory}M",
+                f"-Xms{memory // 2}M",
+                *FABRIC_JVM_ARGS,
+                *(additional_jvm_args or ()),
+            ]
 
             # Create natives directory
-            natives_dir = self.minecraft_dir / "natives" / fabric_version_name
-            natives_dir.mkdir(parents=True, exist_ok=True)
+            natives_dir = os.path.join(self._mc_dir_str, "natives", fabric_version_name)
+            os.makedirs(natives_dir, exist_ok=True)
 
             # Create launch options
             options: _types.MinecraftOptions = {
-                "gameDirectory": str(self.minecraft_dir),
+                "gameDirectory": self._mc_dir_str,
                 "jvmArguments": jvm_args,
-                "nativesDirectory": str(natives_dir),
+                "nativesDirectory": natives_dir,
             }
 
             self.logger.info(f"Generating launch command for Fabric...")
@@ -334,7 +537,7 @@ class FabricLauncher:
             # Generate the launch command
             minecraft_command = await command.get_minecraft_command(
                 fabric_version_name,
-                str(self.minecraft_dir),
+                self._mc_dir_str,
                 options,
                 Credential=Credential,
             )
@@ -342,30 +545,46 @@ class FabricLauncher:
             self.logger.info("✅ Launch command generated successfully!")
 
             # Show launch information
-            mods_dir = self.minecraft_dir / "mods"
-            mod_count = len(list(mods_dir.glob("*.jar"))) if mods_dir.exists() else 0
+            try:
+                with os.scandir(self._mods_dir_str) as it:
+                    mod_count = sum(1 for e in it if e.name.endswith(".jar"))
+            except FileNotFoundError:
+                mod_count = 0
 
             print(f"\n🎮 Ready to launch Minecraft with Fabric")
+            version_data = self.load_version_json(fabric_version_name) or {}
             print(f"   Version: {fabric_version_name}")
+            print(f"   Main Class: {version_data.get('mainClass', 'Unknown')}")
             print(f"   Player: {Credential.username}")
             print(f"   Memory: {memory}MB")
             print(f"   Mods Loaded: {mod_count}")
 
             # Ask user if they want to launch
-            launch_choice = input("\nLaunch now? (Y/n): ").strip().lower()
+            launch_choice = (
+                (await asyncio.to_thread(input, "\nLaunch now? (Y/n): "))
+                .strip()
+                .lower()
+            )
             if launch_choice != "n":
                 print("🚀 Launching Minecraft with Fabric...")
 
-                import subprocess
-
-                process = subprocess.Popen(
-                    minecraft_command,
-                    cwd=str(self.minecraft_dir),
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                )
+                # Send game output to a log file: pipes nobody reads would
+                # stall the game once their buffer fills. A new session keeps
+                # Ctrl-C in this launcher from reaching the game.
+                log_path = self.minecraft_dir / "logs" / f"{fabric_version_name}.log"
+                log_path.parent.mkdir(exist_ok=True)
+                with open(log_path, "ab", buffering=0) as log_file:
+                    process = subprocess.Popen(
+                        minecraft_command,
+                        cwd=self._mc_dir_str,
+                        stdout=log_file,
+                        stderr=subprocess.STDOUT,
+                        start_new_session=True,
+                        close_fds=True,
+                    )
 
                 print(f"✅ Minecraft launched with PID: {process.pid}")
+                print(f"   Game output: {log_path}")
                 print("\n📝 Fabric Notes:")
                 print("   • Fabric mods go in the 'mods' folder")
                 print("   • Fabric has excellent performance")
@@ -389,8 +608,10 @@ async def interactive_fabric_launcher():
     print("Known for excellent performance and quick updates to new versions.")
 
     # Get Minecraft directory
-    minecraft_dir = input(
-        "\nEnter Minecraft directory (or press Enter for default): "
+    minecraft_dir = (
+        await asyncio.to_thread(
+            input, "\nEnter Minecraft directory (or press Enter for default): "
+        )
     ).strip()
     if not minecraft_dir:
         minecraft_dir = os.path.join(os.path.expanduser("~"), ".minecraft")
@@ -399,7 +620,15 @@ async def interactive_fabric_launcher():
 
     # Create launcher
     launcher = FabricLauncher(minecraft_dir)
+    launcher.warm_up()
+    try:
+        await _run_menu(launcher)
+    finally:
+        await launcher.aclose()
+
 
+async def _run_menu(launcher: FabricLauncher) -> None:
+    """Run the interactive menu loop until the user exits."""
     while True:
         print("\n" + "=" * 50)
         print("Fabric Launcher Options:")
@@ -412,13 +641,13 @@ async def interactive_fabric_launcher():
         print("7. Manage mods folder")
         print("8. Exit")
 
-        choice = input("\nEnter your choice (1-8): ").strip()
+        choice = (await asyncio.to_thread(input, "\nEnter your choice (1-8): ")).strip()
 
         if choice == "1":
             # Browse supported versions
             stable_only = (
-                input("Show only stable versions? (Y/n): ").strip().lower() != "n"
-            )
+                await asyncio.to_thread(input, "Show only stable versions? (Y/n): ")
+            ).strip().lower() != "n"
 
             versions = await launcher.get_supported_minecraft_versions(stable_only)
 
@@ -426,21 +655,21 @@ async def interactive_fabric_launcher():
                 print(
                     f"\n🎯 Supported Minecraft Versions ({'stable only' if stable_only else 'all'}):"
                 )
-                # Show recent versions (last 15)
-                recent_versions = versions[:15] if len(versions) > 15 else versions
-                for i, version in enumerate(recent_versions, 1):
+                # Show recent versions (first 15)
+                for i, version in enumerate(itertools.islice(versions, 15), 1):
                     print(f"   {i:2d}. {version}")
 
-                if len(versions) > 15:
-                    print(f"   ... and {len(versions) - 15} more versions")
+                remainder = len(versions) - 15
+                if remainder > 0:
+                    print(f"   ... and {remainder} more versions")
             else:
                 print("❌ No supported versions found")
 
         elif choice == "2":
             # Check latest version
             stable_only = (
-                input("Check latest stable version? (Y/n): ").strip().lower() != "n"
-            )
+                await asyncio.to_thread(input, "Check latest stable version? (Y/n): ")
+            ).strip().lower() != "n"
 
             latest = await launcher.get_latest_minecraft_version(stable_only)
 
@@ -450,7 +679,13 @@ async def interactive_fabric_launcher():
                 )
 
                 install_choice = (
-                    input("Install Fabric for this version? (y/N): ").strip().lower()
+                    (
+                        await asyncio.to_thread(
+                            input, "Install Fabric for this version? (y/N): "
+                        )
+                    )
+                    .strip()
+                    .lower()
                 )
                 if install_choice == "y":
                     await launcher.install_fabric(latest)
@@ -458,23 +693,30 @@ async def interactive_fabric_launcher():
                 print("❌ Failed to get latest version")
 
         elif choice == "3":
-            # Browse loader versions
-            loaders = await launcher.get_fabric_loader_versions()
+            # Browse loader versions; fetch the list and the latest loader together
+            loaders, latest_loader = await asyncio.gather(
+                launcher.get_fabric_loader_versions(),
+                launcher.get_latest_fabric_loader(),
+                return_exceptions=True,
+            )
+            if isinstance(loaders, BaseException):
+                loaders = []
+            if isinstance(latest_loader, BaseException):
+                latest_loader = None
 
             if loaders:
                 print(f"\n🔧 Fabric Loader Versions:")
-                # Show recent loaders (last 10)
-                recent_loaders = loaders[:10] if len(loaders) > 10 else loaders
-                for i, loader in enumerate(recent_loaders, 1):
+                # Show recent loaders (first 10)
+                for i, loader in enumerate(itertools.islice(loaders, 10), 1):
                     version = loader.get("version", "Unknown")
                     stable = " (stable)" if loader.get("stable", False) else ""
                     print(f"   {i:2d}. {version}{stable}")
 
-                if len(loaders) > 10:
-                    print(f"   ... and {len(loaders) - 10} more versions")
+                remainder = len(loaders) - 10
+                if remainder > 0:
+                    print(f"   ... and {remainder} more versions")
 
                 # Show latest
-                latest_loader = await launcher.get_latest_fabric_loader()
                 if latest_loader:
                     print(f"\n✨ Latest loader: {latest_loader}")
             else:
@@ -482,7 +724,9 @@ async def interactive_fabric_launcher():
 
         elif choice == "4":
             # Install Fabric
-            minecraft_version = input("Enter Minecraft version: ").strip()
+            minecraft_version = (
+                await asyncio.to_thread(input, "Enter Minecraft version: ")
+            ).strip()
 
             if minecraft_version:
                 # Check if version is supported
@@ -491,8 +735,11 @@ async def interactive_fabric_launcher():
                 )
 
                 if supported:
-                    loader_version = input(
-                        "Enter Fabric loader version (or press Enter for latest): "
+                    loader_version = (
+                        await asyncio.to_thread(
+                            input,
+                            "Enter Fabric loader version (or press Enter for latest): ",
+                        )
                     ).strip()
                     loader_version = loader_version if loader_version else None
 
@@ -519,27 +766,35 @@ async def interactive_fabric_launcher():
 
         elif choice == "6":
             # Launch with Fabric
-            minecraft_version = input("Enter Minecraft version: ").strip()
+            minecraft_version = (
+                await asyncio.to_thread(input, "Enter Minecraft version: ")
+            ).strip()
 
             if not minecraft_version:
                 print("❌ Minecraft version required")
                 continue
 
             # Get username
-            username = input("Enter username (default: Player): ").strip()
+            username = (
+                await asyncio.to_thread(input, "Enter username (default: Player): ")
+            ).strip()
             if not username:
                 username = "Player"
 
             # Get memory
-            memory_input = input("Enter memory in MB (default: 3072): ").strip()
+            memory_input = (
+                await asyncio.to_thread(input, "Enter memory in MB (default: 3072): ")
+            ).strip()
             try:
                 memory = int(memory_input) if memory_input else 3072
             except ValueError:
                 memory = 3072
 
             # Get loader version (optional)
-            loader_version = input(
-                "Enter Fabric loader version (or press Enter for auto): "
+            loader_version = (
+                await asyncio.to_thread(
+                    input, "Enter Fabric loader version (or press Enter for auto): "
+                )
             ).strip()
             loader_version = loader_version if loader_version else None
 
@@ -555,19 +810,21 @@ async def interactive_fabric_launcher():
             mods_dir = launcher.minecraft_dir / "mods"
             mods_dir.mkdir(exist_ok=True)
 
-            mod_files = list(mods_dir.glob("*.jar"))
+            with os.scandir(mods_dir) as it:
+                mod_files = [e for e in it if e.name.endswith(".jar") and e.is_file()]
 
             print(f"\n📁 Mods Folder: {mods_dir}")
             print(f"   Total mods: {len(mod_files)}")
 
             if mod_files:
                 print("\n   Installed mods:")
-                for mod_file in mod_files[:10]:  # Show first 10
+                for mod_file in itertools.islice(mod_files, 10):  # Show first 10
                     size_mb = mod_file.stat().st_size / (1024 * 1024)
                     print(f"   • {mod_file.name} ({size_mb:.1f} MB)")
 
-                if len(mod_files) > 10:
-                    print(f"   ... and {len(mod_files) - 10} more mods")
+                remainder = len(mod_files) - 10
+                if remainder > 0:
+                    print(f"   ... and {remainder} more mods")
             else:
                 print("   No mods installed")
                 print("\n   💡 Popular Fabric mod sources:")
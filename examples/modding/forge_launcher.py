@@ -24,17 +24,69 @@ import asyncio
 import json
 import logging
 import os
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
 
 from launcher_core import forge, install, command, _types
 from launcher_core.setting import setup_logger
 from launcher_core.exceptions import VersionNotFound, UnsupportedVersion
 
 
+# Forge-specific JVM arguments added after the memory settings
+FORGE_JVM_ARGS: Tuple[str, ...] = (
+    "-XX:+UnlockExperimentalVMOptions",
+    "-XX:+UseG1GC",
+    "-XX:G1NewSizePercent=20",
+    "-XX:G1ReservePercent=20",
+    "-XX:MaxGCPauseMillis=50",
+    "-XX:G1HeapRegionSize=32M",
+)
+
+# Static main menu, written to stdout in a single call
+MENU_TEXT = "\n".join(
+    (
+        "",
+        "=" * 50,
+        "Forge Launcher Options:",
+        "1. Browse available Forge versions",
+        "2. Find recommended Forge version",
+        "3. Install Forge version",
+        "4. List installed Forge versions",
+        "5. Launch Minecraft with Forge",
+        "6. Manage mods folder",
+        "7. Exit",
+        "",
+    )
+)
+
+
+def _iter_jars(mods_dir: Union[str, os.PathLike]) -> Iterator[Tuple[str, int]]:
+    """Yield ``(name, size)`` for the jar files in a mods folder one by one."""
+    try:
+        with os.scandir(mods_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".jar") and entry.is_file(follow_symlinks=False):
+                    yield entry.name, entry.stat(follow_symlinks=False).st_size
+    except FileNotFoundError:
+        return
+
+
 class ForgeLauncher:
     """Minecraft launcher with Forge mod loader support."""
 
+    __slots__ = (
+        "minecraft_dir",
+        "logger",
+        "_minecraft_dir_str",
+        "_versions_cache",
+        "_versions_set",
+        "_versions_fetch",
+        "_filtered_cache",
+        "_installed_sorted",
+        "_installed_name_cache",
+    )
+
     def __init__(self, minecraft_dir: str):
         """
         Initialize the Forge launcher.
@@ -43,15 +95,27 @@ class ForgeLauncher:
             minecraft_dir: Path to the .minecraft directory
         """
         self.minecraft_dir = Path(minecraft_dir)
+        self._minecraft_dir_str = str(self.minecraft_dir)
         self.logger = setup_logger(enable_console=True, level=logging.INFO)
 
-        # Create necessary directories
-        self.minecraft_dir.mkdir(parents=True, exist_ok=True)
-        (self.minecraft_dir / "mods").mkdir(exist_ok=True)
+        # Forge version list for this session, the same versions grouped by
+        # Minecraft version ("<minecraft>-<forge>"), and other filter results.
+        # Tuples keep the shared results safe from callers mutating them
+        self._versions_cache: Optional[Tuple[str, ...]] = None
+        self._versions_set: Optional[FrozenSet[str]] = None
+        self._versions_fetch: Optional[asyncio.Future] = None
+        self._filtered_cache: Dict[str, Tuple[str, ...]] = {}
+        # Sorted installed versions, dropped whenever an install succeeds
+        self._installed_sorted: Optional[Tuple[str, ...]] = None
+        # Forge version -> installed version name
+        self._installed_name_cache: Dict[str, str] = {}
+
+        # Create necessary directories (mods and its parents in one call)
+        os.makedirs(os.path.join(self._minecraft_dir_str, "mods"), exist_ok=True)
 
     async def list_available_forge_versions(
         self, minecraft_version: Optional[str] = None
-    ) -> List[str]:
+    ) -> Tuple[str, ...]:
         """
         List available Forge versions.
 
@@ -62,12 +126,29 @@ class ForgeLauncher:
             List of available Forge versions
         """
         try:
-            self.logger.info("Fetching available Forge versions...")
-            all_versions = await forge.list_forge_versions()
+            all_versions = self._versions_cache
+            if all_versions is None:
+                # Concurrent callers (e.g. the menu prefetch) share one request
+                if self._versions_fetch is None:
+                    self.logger.info("Fetching available Forge versions...")
+                    self._versions_fetch = asyncio.ensure_future(
+                        forge.list_forge_versions()
+                    )
+                fetched = await asyncio.shield(self._versions_fetch)
+                if self._versions_cache is None:
+                    self._versions_cache = tuple(fetched)
+                    self._versions_set = frozenset(self._versions_cache)
+                all_versions = self._versions_cache
 
             if minecraft_version:
-                # Filter versions for specific Minecraft version
-                filtered_versions = [v for v in all_versions if minecraft_version in v]
+                # Substring match, so "1.20" also lists every 1.20.x build;
+                # results are reused until the version list is refreshed
+                filtered_versions = self._filtered_cache.get(minecraft_version)
+                if filtered_versions is None:
+                    filtered_versions = tuple(
+                        v for v in all_versions if minecraft_version in v
+                    )
+                    self._filtered_cache[minecraft_version] = filtered_versions
                 self.logger.info(
                     f"Found {len(filtered_versions)} Forge versions for Minecraft {minecraft_version}"
                 )
@@ -77,8 +158,16 @@ class ForgeLauncher:
             return all_versions
 
         except Exception as e:
+            self._versions_fetch = None
             self.logger.error(f"Failed to fetch Forge versions: {e}")
-            return []
+            return ()
+
+    def refresh_versions(self) -> None:
+        """Forget the cached Forge version list so the next lookup refetches it."""
+        self._versions_cache = None
+        self._versions_set = None
+        self._versions_fetch = None
+        self._filtered_cache.clear()
 
     async def find_recommended_forge_version(
         self, minecraft_version: str
@@ -109,6 +198,12 @@ class ForgeLauncher:
 
     async def is_forge_version_valid(self, forge_version: str) -> bool:
         """Check if a Forge version is valid."""
+        # Validate against the cached version list when it can be loaded
+        if self._versions_set is None:
+            await self.list_available_forge_versions()
+        if self._versions_set is not None:
+            return forge_version in self._versions_set
+
         try:
             return await forge.is_forge_version_valid(forge_version)
         except Exception as e:
@@ -134,15 +229,18 @@ class ForgeLauncher:
             True if installation successful
         """
         try:
-            # Validate version first
-            if not await self.is_forge_version_valid(forge_version):
+            # Validate the version and check automatic install support together
+            valid, auto_install = await asyncio.gather(
+                self.is_forge_version_valid(forge_version),
+                self.supports_automatic_install(forge_version),
+                return_exceptions=True,
+            )
+            if valid is not True:
                 self.logger.error(f"Invalid Forge version: {forge_version}")
                 return False
+            auto_install = auto_install is True
 
             self.logger.info(f"Installing Forge {forge_version}...")
-
-            # Check if automatic installation is supported
-            auto_install = await self.supports_automatic_install(forge_version)
             self.logger.info(f"Automatic installation supported: {auto_install}")
 
             # Create progress callbacks
@@ -164,15 +262,16 @@ class ForgeLauncher:
             if auto_install:
                 # Use automatic installation
                 await forge.install_forge_version(
-                    forge_version, str(self.minecraft_dir), callback
+                    forge_version, self._minecraft_dir_str, callback
                 )
             else:
                 # Run manual installer
                 self.logger.info("Running Forge installer...")
                 await forge.run_forge_installer(
-                    forge_version, str(self.minecraft_dir), callback
+                    forge_version, self._minecraft_dir_str, callback
                 )
 
+            self._installed_sorted = None
             self.logger.info(f"✅ Successfully installed Forge {forge_version}")
             return True
 
@@ -186,24 +285,38 @@ class ForgeLauncher:
             self.logger.error(f"❌ Failed to install Forge {forge_version}: {e}")
             return False
 
-    async def get_installed_forge_versions(self) -> List[str]:
+    async def get_installed_forge_versions(self) -> Tuple[str, ...]:
         """Get list of installed Forge versions."""
-        installed = []
-        versions_dir = self.minecraft_dir / "versions"
-
-        if not versions_dir.exists():
-            return installed
-
-        for version_dir in versions_dir.iterdir():
-            if version_dir.is_dir():
-                # Check if it's a Forge version
-                version_name = version_dir.name
-                if "forge" in version_name.lower():
-                    json_file = version_dir / f"{version_name}.json"
-                    if json_file.exists():
-                        installed.append(version_name)
+        if self._installed_sorted is not None:
+            return self._installed_sorted
 
-        return sorted(installed)
+        installed = []
+        try:
+            with os.scandir(os.path.join(self._minecraft_dir_str, "versions")) as it:
+                for entry in it:
+                    # Check if it's a Forge version directory. Installed Forge
+                    # names use a lowercase "forge" (e.g. "1.20.1-forge-47.2.0"),
+                    # so plain substring tests avoid lowercasing every entry
+                    name = entry.name
+                    if not (
+                        ("forge" in name or "Forge" in name)
+                        and entry.is_dir(follow_symlinks=False)
+                    ):
+                        continue
+                    # A single stat confirms the version JSON is present
+                    try:
+                        os.stat(
+                            os.path.join(entry.path, name + ".json"),
+                            follow_symlinks=False,
+                        )
+                    except FileNotFoundError:
+                        continue
+                    installed.append(name)
+        except FileNotFoundError:
+            return ()
+
+        self._installed_sorted = tuple(sorted(installed))
+        return self._installed_sorted
 
     def create_offline_credential(self, username: str = "Player") -> _types.Credential:
         """Create offline Credential for testing."""
@@ -237,14 +350,22 @@ class ForgeLauncher:
             True if launch successful
         """
         try:
-            # Get the installed version name
-            installed_version = await forge.forge_to_installed_version(forge_version)
+            installed_version = self._installed_name_cache.get(forge_version)
+            if installed_version is None:
+                installed_version = await forge.forge_to_installed_version(
+                    forge_version
+                )
+                self._installed_name_cache[forge_version] = installed_version
+            installed_versions = await self.get_installed_forge_versions()
 
             # Check if version is installed
-            installed_versions = await self.get_installed_forge_versions()
             if installed_version not in installed_versions:
                 self.logger.warning(f"Forge version {forge_version} not installed")
-                install_choice = input("Install it now? (Y/n): ").strip().lower()
+                install_choice = (
+                    (await asyncio.to_thread(input, "Install it now? (Y/n): "))
+                    .strip()
+                    .lower()
+                )
 
                 if install_choice != "n":
                     if not await self.install_forge(forge_version):
@@ -257,32 +378,22 @@ class ForgeLauncher:
                 Credential = self.create_offline_credential(username)
 
             # Set up JVM arguments (Forge typically needs more memory)
-            jvm_args = [f"-Xmx{memory}M", f"-Xms{memory//2}M"]
-
-            # Add Forge-specific JVM arguments
-            jvm_args.extend(
-                [
-                    "-XX:+UnlockExperimentalVMOptions",
-                    "-XX:+UseG1GC",
-                    "-XX:G1NewSizePercent=20",
-                    "-XX:G1ReservePercent=20",
-                    "-XX:MaxGCPauseMillis=50",
-                    "-XX:G1HeapRegionSize=32M",
-                ]
-            )
+            jvm_args = [f"-Xmx{memory}M", f"-Xms{memory // 2}M", *FORGE_JVM_ARGS]
 
             if additional_jvm_args:
                 jvm_args.extend(additional_jvm_args)
 
             # Create natives directory
-            natives_dir = self.minecraft_dir / "natives" / installed_version
-            natives_dir.mkdir(parents=True, exist_ok=True)
+            natives_dir = os.path.join(
+                self._minecraft_dir_str, "natives", installed_version
+            )
+            os.makedirs(natives_dir, exist_ok=True)
 
             # Create launch options
             options: _types.MinecraftOptions = {
-                "gameDirectory": str(self.minecraft_dir),
+                "gameDirectory": self._minecraft_dir_str,
                 "jvmArguments": jvm_args,
-                "nativesDirectory": str(natives_dir),
+                "nativesDirectory": natives_dir,
             }
 
             self.logger.info(f"Generating launch command for Forge {forge_version}...")
@@ -292,7 +403,7 @@ class ForgeLauncher:
             # Generate the launch command
             minecraft_command = await command.get_minecraft_command(
                 installed_version,
-                str(self.minecraft_dir),
+                self._minecraft_dir_str,
                 options,
                 Credential=Credential,
             )
@@ -300,8 +411,8 @@ class ForgeLauncher:
             self.logger.info("✅ Launch command generated successfully!")
 
             # Show launch information
-            mods_dir = self.minecraft_dir / "mods"
-            mod_count = len(list(mods_dir.glob("*.jar"))) if mods_dir.exists() else 0
+            mods_dir = os.path.join(self._minecraft_dir_str, "mods")
+            mod_count = sum(1 for _ in _iter_jars(mods_dir))
 
             print(f"\n🎮 Ready to launch Minecraft with Forge")
             print(f"   Forge Version: {forge_version}")
@@ -311,17 +422,21 @@ class ForgeLauncher:
             print(f"   Mods Loaded: {mod_count}")
 
             # Ask user if they want to launch
-            launch_choice = input("\nLaunch now? (Y/n): ").strip().lower()
+            launch_choice = (
+                (await asyncio.to_thread(input, "\nLaunch now? (Y/n): "))
+                .strip()
+                .lower()
+            )
             if launch_choice != "n":
                 print("🚀 Launching Minecraft with Forge...")
 
-                import subprocess
-
-                process = subprocess.Popen(
-                    minecraft_command,
-                    cwd=str(self.minecraft_dir),
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
+                # Nothing reads the game's output, so discard it rather than
+                # letting unread pipes fill up and stall the process
+                process = await asyncio.create_subprocess_exec(
+                    *minecraft_command,
+                    cwd=self._minecraft_dir_str,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL,
                 )
 
                 print(f"✅ Minecraft launched with PID: {process.pid}")
@@ -340,6 +455,161 @@ class ForgeLauncher:
             self.logger.error(f"❌ Failed to launch Forge: {e}")
             return False
 
+    # Interactive menu commands
+
+    async def _cmd_browse(self) -> None:
+        """Browse Forge versions."""
+        minecraft_version = (
+            await asyncio.to_thread(
+                input, "Filter by Minecraft version (or press Enter for all): "
+            )
+        ).strip()
+        minecraft_version = minecraft_version if minecraft_version else None
+
+        versions = await self.list_available_forge_versions(minecraft_version)
+
+        if versions:
+            parts = ["\n🔧 Available Forge Versions:\n"]
+            # Show recent versions (last 10)
+            parts.extend(
+                f"   {i:2d}. {version}\n" for i, version in enumerate(versions[:10], 1)
+            )
+            if len(versions) > 10:
+                parts.append(f"   ... and {len(versions) - 10} more versions\n")
+            sys.stdout.write("".join(parts))
+        else:
+            print("❌ No Forge versions found")
+
+    async def _cmd_recommend(self) -> None:
+        """Find the recommended version and offer to install it."""
+        minecraft_version = (
+            await asyncio.to_thread(input, "Enter Minecraft version (e.g., 1.21.1): ")
+        ).strip()
+
+        if minecraft_version:
+            recommended = await self.find_recommended_forge_version(minecraft_version)
+
+            if recommended:
+                print(f"✅ Recommended Forge version: {recommended}")
+
+                install_choice = (
+                    (await asyncio.to_thread(input, "Install this version? (y/N): "))
+                    .strip()
+                    .lower()
+                )
+                if install_choice == "y":
+                    await self.install_forge(recommended)
+            else:
+                print(f"❌ No Forge version found for Minecraft {minecraft_version}")
+
+    async def _cmd_install(self) -> None:
+        """Install a Forge version."""
+        forge_version = (
+            await asyncio.to_thread(input, "Enter Forge version to install: ")
+        ).strip()
+
+        if forge_version:
+            success = await self.install_forge(forge_version)
+            if not success:
+                print("❌ Installation failed")
+
+    async def _cmd_list_installed(self) -> None:
+        """List installed versions."""
+        installed = await self.get_installed_forge_versions()
+
+        print(f"\n💾 Installed Forge Versions ({len(installed)} total):")
+        if installed:
+            sys.stdout.write("".join(f"   🟢 {version}\n" for version in installed))
+        else:
+            print("   No Forge versions installed")
+
+    async def _cmd_launch(self) -> None:
+        """Launch with Forge."""
+        installed = await self.get_installed_forge_versions()
+
+        if not installed:
+            print("❌ No Forge versions installed")
+            return
+
+        sys.stdout.write(
+            "\nInstalled Forge versions:\n"
+            + "".join(f"{i}. {version}\n" for i, version in enumerate(installed, 1))
+        )
+
+        # Get version selection
+        version_choice = (
+            await asyncio.to_thread(input, "Enter version number or name: ")
+        ).strip()
+
+        if version_choice.isdigit() and 1 <= int(version_choice) <= len(installed):
+            selected_version = installed[int(version_choice) - 1]
+            # Extract forge version from installed version name
+            forge_version = (
+                selected_version.split("-forge-")[1]
+                if "-forge-" in selected_version
+                else selected_version
+            )
+        else:
+            forge_version = version_choice
+
+        # Get username
+        username = (
+            await asyncio.to_thread(input, "Enter username (default: Player): ")
+        ).strip()
+        if not username:
+            username = "Player"
+
+        # Get memory
+        memory_input = (
+            await asyncio.to_thread(input, "Enter memory in MB (default: 4096): ")
+        ).strip()
+        try:
+            memory = int(memory_input) if memory_input else 4096
+        except ValueError:
+            memory = 4096
+
+        # Launch
+        success = await self.launch_forge(forge_version, username, memory)
+        if not success:
+            print("❌ Launch failed")
+
+    async def _cmd_mods(self) -> None:
+        """Manage mods folder."""
+        mods_dir = self.minecraft_dir / "mods"
+        mods_dir.mkdir(exist_ok=True)
+
+        # Keep only the first 10 entries for display; count the rest
+        mod_files = []
+        mod_count = 0
+        total_size = 0
+        for name, size in _iter_jars(mods_dir):
+            if mod_count < 10:
+                mod_files.append((name, size))
+            mod_count += 1
+            total_size += size
+
+        print(f"\n📁 Mods Folder: {mods_dir}")
+        print(f"   Total mods: {mod_count} ({total_size / (1024 * 1024):.1f} MB)")
+
+        if mod_files:
+            parts = ["\n   Installed mods:\n"]
+            for name, size in mod_files:
+                parts.append(f"   • {name} ({size / (1024 * 1024):.1f} MB)\n")
+
+            if mod_count > 10:
+                parts.append(f"   ... and {mod_count - 10} more mods\n")
+            sys.stdout.write("".join(parts))
+        else:
+            print("   No mods installed")
+            print("\n   💡 To add mods:")
+            print("   1. Download .jar mod files")
+            print(f"   2. Place them in: {mods_dir}")
+            print("   3. Launch Minecraft with Forge")
+
+    async def _cmd_invalid(self) -> None:
+        """Report an unknown menu choice."""
+        print("Invalid choice. Please try again.")
+
 
 async def interactive_forge_launcher():
     """Interactive Forge launcher interface."""
@@ -353,8 +623,10 @@ async def interactive_forge_launcher():
     print("https://www.patreon.com/LexManos/")
 
     # Get Minecraft directory
-    minecraft_dir = input(
-        "\nEnter Minecraft directory (or press Enter for default): "
+    minecraft_dir = (
+        await asyncio.to_thread(
+            input, "\nEnter Minecraft directory (or press Enter for default): "
+        )
     ).strip()
     if not minecraft_dir:
         minecraft_dir = os.path.join(os.path.expanduser("~"), ".minecraft")
@@ -363,159 +635,30 @@ async def interactive_forge_launcher():
 
     # Create launcher
     launcher = ForgeLauncher(minecraft_dir)
+    prefetch: Optional[asyncio.Task] = None
+    handlers = {
+        "1": launcher._cmd_browse,
+        "2": launcher._cmd_recommend,
+        "3": launcher._cmd_install,
+        "4": launcher._cmd_list_installed,
+        "5": launcher._cmd_launch,
+        "6": launcher._cmd_mods,
+    }
 
     while True:
-        print("\n" + "=" * 50)
-        print("Forge Launcher Options:")
-        print("1. Browse available Forge versions")
-        print("2. Find recommended Forge version")
-        print("3. Install Forge version")
-        print("4. List installed Forge versions")
-        print("5. Launch Minecraft with Forge")
-        print("6. Manage mods folder")
-        print("7. Exit")
-
-        choice = input("\nEnter your choice (1-7): ").strip()
-
-        if choice == "1":
-            # Browse Forge versions
-            minecraft_version = input(
-                "Filter by Minecraft version (or press Enter for all): "
-            ).strip()
-            minecraft_version = minecraft_version if minecraft_version else None
-
-            versions = await launcher.list_available_forge_versions(minecraft_version)
-
-            if versions:
-                print(f"\n🔧 Available Forge Versions:")
-                # Show recent versions (last 10)
-                recent_versions = versions[:10] if len(versions) > 10 else versions
-                for i, version in enumerate(recent_versions, 1):
-                    print(f"   {i:2d}. {version}")
-
-                if len(versions) > 10:
-                    print(f"   ... and {len(versions) - 10} more versions")
-            else:
-                print("❌ No Forge versions found")
-
-        elif choice == "2":
-            # Find recommended version
-            minecraft_version = input(
-                "Enter Minecraft version (e.g., 1.21.1): "
-            ).strip()
-
-            if minecraft_version:
-                recommended = await launcher.find_recommended_forge_version(
-                    minecraft_version
-                )
-
-                if recommended:
-                    print(f"✅ Recommended Forge version: {recommended}")
-
-                    install_choice = (
-                        input("Install this version? (y/N): ").strip().lower()
-                    )
-                    if install_choice == "y":
-                        await launcher.install_forge(recommended)
-                else:
-                    print(
-                        f"❌ No Forge version found for Minecraft {minecraft_version}"
-                    )
+        sys.stdout.write(MENU_TEXT)
+        sys.stdout.flush()
 
-        elif choice == "3":
-            # Install Forge version
-            forge_version = input("Enter Forge version to install: ").strip()
+        # Fetch the version list while the user picks an option
+        if prefetch is None:
+            prefetch = asyncio.create_task(launcher.list_available_forge_versions())
 
-            if forge_version:
-                success = await launcher.install_forge(forge_version)
-                if not success:
-                    print("❌ Installation failed")
-
-        elif choice == "4":
-            # List installed versions
-            installed = await launcher.get_installed_forge_versions()
-
-            print(f"\n💾 Installed Forge Versions ({len(installed)} total):")
-            if installed:
-                for version in installed:
-                    print(f"   🟢 {version}")
-            else:
-                print("   No Forge versions installed")
-
-        elif choice == "5":
-            # Launch with Forge
-            installed = await launcher.get_installed_forge_versions()
-
-            if not installed:
-                print("❌ No Forge versions installed")
-                continue
-
-            print(f"\nInstalled Forge versions:")
-            for i, version in enumerate(installed, 1):
-                print(f"{i}. {version}")
-
-            # Get version selection
-            version_choice = input("Enter version number or name: ").strip()
-
-            if version_choice.isdigit() and 1 <= int(version_choice) <= len(installed):
-                selected_version = installed[int(version_choice) - 1]
-                # Extract forge version from installed version name
-                forge_version = (
-                    selected_version.split("-forge-")[1]
-                    if "-forge-" in selected_version
-                    else selected_version
-                )
-            else:
-                forge_version = version_choice
-
-            # Get username
-            username = input("Enter username (default: Player): ").strip()
-            if not username:
-                username = "Player"
-
-            # Get memory
-            memory_input = input("Enter memory in MB (default: 4096): ").strip()
-            try:
-                memory = int(memory_input) if memory_input else 4096
-            except ValueError:
-                memory = 4096
-
-            # Launch
-            success = await launcher.launch_forge(forge_version, username, memory)
-            if not success:
-                print("❌ Launch failed")
-
-        elif choice == "6":
-            # Manage mods folder
-            mods_dir = launcher.minecraft_dir / "mods"
-            mods_dir.mkdir(exist_ok=True)
-
-            mod_files = list(mods_dir.glob("*.jar"))
-
-            print(f"\n📁 Mods Folder: {mods_dir}")
-            print(f"   Total mods: {len(mod_files)}")
-
-            if mod_files:
-                print("\n   Installed mods:")
-                for mod_file in mod_files[:10]:  # Show first 10
-                    size_mb = mod_file.stat().st_size / (1024 * 1024)
-                    print(f"   • {mod_file.name} ({size_mb:.1f} MB)")
-
-                if len(mod_files) > 10:
-                    print(f"   ... and {len(mod_files) - 10} more mods")
-            else:
-                print("   No mods installed")
-                print("\n   💡 To add mods:")
-                print("   1. Download .jar mod files")
-                print(f"   2. Place them in: {mods_dir}")
-                print("   3. Launch Minecraft with Forge")
-
-        elif choice == "7":
+        choice = (await asyncio.to_thread(input, "\nEnter your choice (1-7): ")).strip()
+        if choice == "7":
             print("Goodbye!")
             break
 
-        else:
-            print("Invalid choice. Please try again.")
+        await handlers.get(choice, launcher._cmd_invalid)()
 
 
 async def main():
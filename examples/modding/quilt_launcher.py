@@ -27,13 +27,46 @@ import asyncio
 import json
 import logging
 import os
+import subprocess
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from uuid import uuid4
+
+import aiohttp
 
 from launcher_core import quilt, install, command, _types
 from launcher_core.setting import setup_logger
 from launcher_core.exceptions import VersionNotFound, UnsupportedVersion
 
+# How long Quilt meta results are reused before asking the server again
+METADATA_TTL = 300
+# Most Quilt meta requests in flight at once while prefetching
+PREFETCH_CONCURRENCY = 5
+
+
+def _iter_mod_jars(mods_dir: Union[str, os.PathLike]) -> Iterator[os.DirEntry]:
+    """Yield the jar files in a mods folder one by one."""
+    try:
+        with os.scandir(mods_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".jar") and entry.is_file():
+                    yield entry
+    except FileNotFoundError:
+        return
+
 
 class QuiltLauncher:
     """Minecraft launcher with Quilt mod loader support."""
@@ -47,14 +80,100 @@ class QuiltLauncher:
         """
         self.minecraft_dir = Path(minecraft_dir)
         self.logger = setup_logger(enable_console=True, level=logging.INFO)
+        # Cached Quilt metadata: key -> (fetch time, value); see _cached
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        # In-flight fetches per cache key, shared by concurrent callers
+        self._pending: Dict[str, asyncio.Future] = {}
+        # One pooled session for all Quilt meta requests, created on first use
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Background metadata prefetch started by warm_up()
+        self._sem = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+        self._prefetch: Optional[asyncio.Task] = None
 
         # Create necessary directories
         self.minecraft_dir.mkdir(parents=True, exist_ok=True)
         (self.minecraft_dir / "mods").mkdir(exist_ok=True)
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it if needed."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300)
+            )
+        return self._session
+
+    def warm_up(self) -> None:
+        """Start filling the metadata cache in the background."""
+        if self._prefetch is None:
+            self._prefetch = asyncio.create_task(self._prefetch_all_meta())
+
+    async def _prefetch_all_meta(self) -> None:
+        """Fetch the metadata the menu shows first, a few requests at a time."""
+
+        async def limited(fetch: Callable[[], Awaitable[Any]]) -> None:
+            async with self._sem:
+                await fetch()
+
+        await asyncio.gather(
+            limited(lambda: self.get_supported_minecraft_versions(True)),
+            limited(self.get_quilt_loader_versions),
+            limited(self.get_latest_quilt_loader),
+        )
+
+    async def aclose(self) -> None:
+        """Cancel pending fetches and close the shared HTTP session."""
+        if self._prefetch is not None and not self._prefetch.done():
+            self._prefetch.cancel()
+        # Shielded fetches outlive the prefetch cancel, so stop them too
+        pending = list(self._pending.values())
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _cached(
+        self, key: str, ttl: float, factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return the cached value for ``key``, refetching it once ``ttl`` expires.
+
+        Concurrent calls for the same key share one in-flight fetch. Lists are
+        stored as tuples, since cached results are shared between callers.
+        """
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._pending[key] = task
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+
+        value = await asyncio.shield(task)
+        if isinstance(value, list):
+            value = tuple(value)
+        self._cache[key] = (time.monotonic(), value)
+        return value
+
+    async def _get_supported_set(self) -> FrozenSet[str]:
+        """All Minecraft versions Quilt supports, from one metadata request."""
+
+        async def build() -> FrozenSet[str]:
+            all_versions = await self._cached(
+                "all_minecraft_versions",
+                METADATA_TTL,
+                lambda: quilt.get_all_minecraft_versions(session=self._get_session()),
+            )
+            return frozenset(v["version"] for v in all_versions)
+
+        return await self._cached("supported_set", METADATA_TTL, build)
+
     async def get_supported_minecraft_versions(
         self, stable_only: bool = True
-    ) -> List[str]:
+    ) -> Sequence[str]:
         """
         Get Minecraft versions supported by Quilt.
 
@@ -66,12 +185,24 @@ class QuiltLauncher:
         """
         try:
             if stable_only:
-                versions = await quilt.get_stable_minecraft_versions()
+                versions = await self._cached(
+                    "stable_minecraft_versions",
+                    METADATA_TTL,
+                    lambda: quilt.get_stable_minecraft_versions(
+                        session=self._get_session()
+                    ),
+                )
                 self.logger.info(
                     f"Found {len(versions)} stable Minecraft versions for Quilt"
                 )
             else:
-                all_versions = await quilt.get_all_minecraft_versions()
+                all_versions = await self._cached(
+                    "all_minecraft_versions",
+                    METADATA_TTL,
+                    lambda: quilt.get_all_minecraft_versions(
+                        session=self._get_session()
+                    ),
+                )
                 versions = [v["version"] for v in all_versions]
                 self.logger.info(
                     f"Found {len(versions)} total Minecraft versions for Quilt"
@@ -89,9 +220,13 @@ class QuiltLauncher:
         """Get the latest Minecraft version supported by Quilt."""
         try:
             if stable_only:
-                version = await quilt.get_latest_stable_minecraft_version()
+                version = await quilt.get_latest_stable_minecraft_version(
+                    session=self._get_session()
+                )
             else:
-                version = await quilt.get_latest_minecraft_version()
+                version = await quilt.get_latest_minecraft_version(
+                    session=self._get_session()
+                )
 
             self.logger.info(
                 f"Latest {'stable ' if stable_only else ''}Minecraft version: {version}"
@@ -105,17 +240,21 @@ class QuiltLauncher:
     async def is_minecraft_version_supported(self, version: str) -> bool:
         """Check if a Minecraft version is supported by Quilt."""
         try:
-            supported = await quilt.is_minecraft_version_supported(version)
+            supported = version in await self._get_supported_set()
             self.logger.info(f"Minecraft {version} Quilt support: {supported}")
             return supported
         except Exception as e:
             self.logger.error(f"Failed to check version support: {e}")
             return False
 
-    async def get_quilt_loader_versions(self) -> List[Dict]:
+    async def get_quilt_loader_versions(self) -> Sequence[Dict]:
         """Get available Quilt loader versions."""
         try:
-            loaders = await quilt.get_all_loader_versions()
+            loaders = await self._cached(
+                "loader_versions",
+                METADATA_TTL,
+                lambda: quilt.get_all_loader_versions(session=self._get_session()),
+            )
             self.logger.info(f"Found {len(loaders)} Quilt loader versions")
             return loaders
         except Exception as e:
@@ -125,7 +264,11 @@ class QuiltLauncher:
     async def get_latest_quilt_loader(self) -> Optional[str]:
         """Get the latest Quilt loader version."""
         try:
-            loader_version = await quilt.get_latest_loader_version()
+            loader_version = await self._cached(
+                "latest_loader_version",
+                METADATA_TTL,
+                lambda: quilt.get_latest_loader_version(session=self._get_session()),
+            )
             self.logger.info(f"Latest Quilt loader: {loader_version}")
             return loader_version
         except Exception as e:
@@ -134,7 +277,7 @@ class QuiltLauncher:
 
     async def install_quilt(
         self, minecraft_version: str, loader_version: Optional[str] = None
-    ) -> bool:
+    ) -> Optional[str]:
         """
         Install Quilt for a specific Minecraft version.
 
@@ -143,22 +286,28 @@ class QuiltLauncher:
             loader_version: Quilt loader version (latest if None)
 
         Returns:
-            True if installation successful
+            The installed Quilt version name, or None if installation failed
         """
         try:
-            # Check if Minecraft version is supported
-            if not await self.is_minecraft_version_supported(minecraft_version):
+            # Check support and, if needed, look up the latest loader together
+            if loader_version:
+                supported = await self.is_minecraft_version_supported(minecraft_version)
+            else:
+                supported, loader_version = await asyncio.gather(
+                    self.is_minecraft_version_supported(minecraft_version),
+                    self.get_latest_quilt_loader(),
+                )
+
+            if not supported:
                 self.logger.error(
                     f"Minecraft {minecraft_version} is not supported by Quilt"
                 )
-                return False
+                return None
 
             # Use latest loader if none specified
             if not loader_version:
-                loader_version = await self.get_latest_quilt_loader()
-                if not loader_version:
-                    self.logger.error("Failed to get Quilt loader version")
-                    return False
+                self.logger.error("Failed to get Quilt loader version")
+                return None
 
             self.logger.info(
                 f"Installing Quilt {loader_version} for Minecraft {minecraft_version}..."
@@ -191,44 +340,66 @@ class QuiltLauncher:
             self.logger.info(
                 f"✅ Successfully installed Quilt {loader_version} for Minecraft {minecraft_version}"
             )
-            return True
+            return f"quilt-loader-{loader_version}-{minecraft_version}"
 
         except VersionNotFound:
             self.logger.error(f"❌ Minecraft version {minecraft_version} not found")
-            return False
+            return None
         except UnsupportedVersion:
             self.logger.error(
                 f"❌ Minecraft version {minecraft_version} is unsupported by Quilt"
             )
-            return False
+            return None
         except Exception as e:
             self.logger.error(f"❌ Failed to install Quilt: {e}")
-            return False
+            return None
 
     async def get_installed_quilt_versions(self) -> List[str]:
         """Get list of installed Quilt versions."""
-        installed = []
-        versions_dir = self.minecraft_dir / "versions"
+        # Scan in a worker thread so the event loop stays responsive
+        return await asyncio.to_thread(self._scan_installed_quilt_sync)
 
-        if not versions_dir.exists():
-            return installed
+    def _scan_installed_quilt_sync(self) -> List[str]:
+        """Blocking scan of the versions folder for installed Quilt versions."""
+        return sorted(self._iter_quilt_versions_for(""))
 
-        for version_dir in versions_dir.iterdir():
-            if version_dir.is_dir():
-                version_name = version_dir.name
-                # Check if it's a Quilt version
-                if "quilt" in version_name.lower():
-                    json_file = version_dir / f"{version_name}.json"
-                    if json_file.exists():
-                        installed.append(version_name)
+    def _iter_quilt_versions_for(self, minecraft_version: str) -> Iterator[str]:
+        """
+        Lazily yield installed Quilt versions for ``minecraft_version``
+        (every installed Quilt version for ``""``).
 
-        return sorted(installed)
+        Installed names follow ``quilt-loader-{loader}-{mc}``, so matching the
+        suffix keeps "1.20" from picking up a "1.20.1" install.
+        """
+        suffix = f"-{minecraft_version}" if minecraft_version else ""
+        try:
+            with os.scandir(os.path.join(self.minecraft_dir, "versions")) as it:
+                for entry in it:
+                    # Check if it's a matching Quilt version with its version JSON
+                    name = entry.name
+                    if (
+                        name.endswith(suffix)
+                        and "quilt" in name.lower()
+                        and entry.is_dir()
+                        and os.path.isfile(os.path.join(entry.path, f"{name}.json"))
+                    ):
+                        yield name
+        except FileNotFoundError:
+            return
+
+    def _first_quilt_version_sync(self, minecraft_version: str) -> Optional[str]:
+        """Stop the versions scan at the first match."""
+        return next(self._iter_quilt_versions_for(minecraft_version), None)
+
+    async def _find_quilt_version(self, minecraft_version: str) -> Optional[str]:
+        """Return the first installed Quilt version for a Minecraft version."""
+        return await asyncio.to_thread(
+            self._first_quilt_version_sync, minecraft_version
+        )
 
     def create_offline_credential(self, username: str = "Player") -> _types.Credential:
         """Create offline Credential for testing."""
-        import uuid
-
-        fake_uuid = str(uuid.uuid4())
+        fake_uuid = str(uuid4())
 
         return _types.Credential(
             access_token="offline", username=username, uuid=fake_uuid
@@ -259,47 +430,34 @@ class QuiltLauncher:
         """
         try:
             # Check if Quilt is installed for this version
-            installed_versions = await self.get_installed_quilt_versions()
-
-            # Find matching installed version
-            quilt_version_name = None
-            for installed in installed_versions:
-                if minecraft_version in installed and "quilt" in installed.lower():
-                    quilt_version_name = installed
-                    break
+            quilt_version_name = await self._find_quilt_version(minecraft_version)
 
             if not quilt_version_name:
                 self.logger.warning(
                     f"Quilt not installed for Minecraft {minecraft_version}"
                 )
-                install_choice = input("Install Quilt now? (Y/n): ").strip().lower()
+                install_choice = (
+                    (await asyncio.to_thread(input, "Install Quilt now? (Y/n): "))
+                    .strip()
+                    .lower()
+                )
 
                 if install_choice != "n":
-                    if not await self.install_quilt(minecraft_version, loader_version):
+                    # The installer reports the version name, so no rescan
+                    quilt_version_name = await self.install_quilt(
+                        minecraft_version, loader_version
+                    )
+                    if not quilt_version_name:
                         return False
-
-                    # Find the newly installed version
-                    updated_versions = await self.get_installed_quilt_versions()
-                    for installed in updated_versions:
-                        if (
-                            minecraft_version in installed
-                            and "quilt" in installed.lower()
-                        ):
-                            quilt_version_name = installed
-                            break
                 else:
                     return False
 
-            if not quilt_version_name:
-                self.logger.error("Failed to find installed Quilt version")
-                return False
-
             # Use provided Credential or create offline ones
             if not Credential:
                 Credential = self.create_offline_credential(username)
 
             # Set up JVM arguments (Quilt inherits Fabric's efficiency)
-            jvm_args = [f"-Xmx{memory}M", f"-Xms{memory//2}M"]
+            jvm_args = [f"-Xmx{memory}M", f"-Xms{memory // 2}M"]
 
             # Add Quilt-optimized JVM arguments
             jvm_args.extend(
@@ -343,7 +501,7 @@ class QuiltLauncher:
 
             # Show launch information
             mods_dir = self.minecraft_dir / "mods"
-            mod_count = len(list(mods_dir.glob("*.jar"))) if mods_dir.exists() else 0
+            mod_count = sum(1 for _ in _iter_mod_jars(mods_dir))
 
             print(f"\n🎮 Ready to launch Minecraft with Quilt")
             print(f"   Version: {quilt_version_name}")
@@ -352,17 +510,23 @@ class QuiltLauncher:
             print(f"   Mods Loaded: {mod_count}")
 
             # Ask user if they want to launch
-            launch_choice = input("\nLaunch now? (Y/n): ").strip().lower()
+            launch_choice = (
+                (await asyncio.to_thread(input, "\nLaunch now? (Y/n): "))
+                .strip()
+                .lower()
+            )
             if launch_choice != "n":
                 print("🚀 Launching Minecraft with Quilt...")
 
-                import subprocess
-
+                # Nothing reads the game's output, so discard it rather than
+                # letting unread pipes fill up and stall the process. A new
+                # session keeps Ctrl-C in the launcher from killing the game
                 process = subprocess.Popen(
                     minecraft_command,
                     cwd=str(self.minecraft_dir),
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
                 )
 
                 print(f"✅ Minecraft launched with PID: {process.pid}")
@@ -389,8 +553,10 @@ async def interactive_quilt_launcher():
     print("It supports most Fabric mods while providing additional features.")
 
     # Get Minecraft directory
-    minecraft_dir = input(
-        "\nEnter Minecraft directory (or press Enter for default): "
+    minecraft_dir = (
+        await asyncio.to_thread(
+            input, "\nEnter Minecraft directory (or press Enter for default): "
+        )
     ).strip()
     if not minecraft_dir:
         minecraft_dir = os.path.join(os.path.expanduser("~"), ".minecraft")
@@ -399,7 +565,15 @@ async def interactive_quilt_launcher():
 
     # Create launcher
     launcher = QuiltLauncher(minecraft_dir)
+    launcher.warm_up()
+    try:
+        await _run_menu(launcher)
+    finally:
+        await launcher.aclose()
+
 
+async def _run_menu(launcher: QuiltLauncher) -> None:
+    """Run the interactive menu loop until the user exits."""
     while True:
         print("\n" + "=" * 50)
         print("Quilt Launcher Options:")
@@ -413,13 +587,13 @@ async def interactive_quilt_launcher():
         print("8. Quilt vs Fabric information")
         print("9. Exit")
 
-        choice = input("\nEnter your choice (1-9): ").strip()
+        choice = (await asyncio.to_thread(input, "\nEnter your choice (1-9): ")).strip()
 
         if choice == "1":
             # Browse supported versions
             stable_only = (
-                input("Show only stable versions? (Y/n): ").strip().lower() != "n"
-            )
+                await asyncio.to_thread(input, "Show only stable versions? (Y/n): ")
+            ).strip().lower() != "n"
 
             versions = await launcher.get_supported_minecraft_versions(stable_only)
 
@@ -440,8 +614,8 @@ async def interactive_quilt_launcher():
         elif choice == "2":
             # Check latest version
             stable_only = (
-                input("Check latest stable version? (Y/n): ").strip().lower() != "n"
-            )
+                await asyncio.to_thread(input, "Check latest stable version? (Y/n): ")
+            ).strip().lower() != "n"
 
             latest = await launcher.get_latest_minecraft_version(stable_only)
 
@@ -451,7 +625,13 @@ async def interactive_quilt_launcher():
                 )
 
                 install_choice = (
-                    input("Install Quilt for this version? (y/N): ").strip().lower()
+                    (
+                        await asyncio.to_thread(
+                            input, "Install Quilt for this version? (y/N): "
+                        )
+                    )
+                    .strip()
+                    .lower()
                 )
                 if install_choice == "y":
                     await launcher.install_quilt(latest)
@@ -459,8 +639,11 @@ async def interactive_quilt_launcher():
                 print("❌ Failed to get latest version")
 
         elif choice == "3":
-            # Browse loader versions
-            loaders = await launcher.get_quilt_loader_versions()
+            # Browse loader versions, fetching the latest loader alongside
+            loaders, latest_loader = await asyncio.gather(
+                launcher.get_quilt_loader_versions(),
+                launcher.get_latest_quilt_loader(),
+            )
 
             if loaders:
                 print(f"\n🧵 Quilt Loader Versions:")
@@ -475,7 +658,6 @@ async def interactive_quilt_launcher():
                     print(f"   ... and {len(loaders) - 10} more versions")
 
                 # Show latest
-                latest_loader = await launcher.get_latest_quilt_loader()
                 if latest_loader:
                     print(f"\n✨ Latest loader: {latest_loader}")
             else:
@@ -483,7 +665,9 @@ async def interactive_quilt_launcher():
 
         elif choice == "4":
             # Install Quilt
-            minecraft_version = input("Enter Minecraft version: ").strip()
+            minecraft_version = (
+                await asyncio.to_thread(input, "Enter Minecraft version: ")
+            ).strip()
 
             if minecraft_version:
                 # Check if version is supported
@@ -492,8 +676,11 @@ async def interactive_quilt_launcher():
                 )
 
                 if supported:
-                    loader_version = input(
-                        "Enter Quilt loader version (or press Enter for latest): "
+                    loader_version = (
+                        await asyncio.to_thread(
+                            input,
+                            "Enter Quilt loader version (or press Enter for latest): ",
+                        )
                     ).strip()
                     loader_version = loader_version if loader_version else None
 
@@ -518,27 +705,35 @@ async def interactive_quilt_launcher():
 
         elif choice == "6":
             # Launch with Quilt
-            minecraft_version = input("Enter Minecraft version: ").strip()
+            minecraft_version = (
+                await asyncio.to_thread(input, "Enter Minecraft version: ")
+            ).strip()
 
             if not minecraft_version:
                 print("❌ Minecraft version required")
                 continue
 
             # Get username
-            username = input("Enter username (default: Player): ").strip()
+            username = (
+                await asyncio.to_thread(input, "Enter username (default: Player): ")
+            ).strip()
             if not username:
                 username = "Player"
 
             # Get memory
-            memory_input = input("Enter memory in MB (default: 3072): ").strip()
+            memory_input = (
+                await asyncio.to_thread(input, "Enter memory in MB (default: 3072): ")
+            ).strip()
             try:
                 memory = int(memory_input) if memory_input else 3072
             except ValueError:
                 memory = 3072
 
             # Get loader version (optional)
-            loader_version = input(
-                "Enter Quilt loader version (or press Enter for auto): "
+            loader_version = (
+                await asyncio.to_thread(
+                    input, "Enter Quilt loader version (or press Enter for auto): "
+                )
             ).strip()
             loader_version = loader_version if loader_version else None
 
@@ -554,7 +749,7 @@ async def interactive_quilt_launcher():
             mods_dir = launcher.minecraft_dir / "mods"
             mods_dir.mkdir(exist_ok=True)
 
-            mod_files = list(mods_dir.glob("*.jar"))
+            mod_files = list(_iter_mod_jars(mods_dir))
 
             print(f"\n📁 Mods Folder: {mods_dir}")
             print(f"   Total mods: {len(mod_files)}")
@@ -562,6 +757,7 @@ async def interactive_quilt_launcher():
             if mod_files:
                 print("\n   Installed mods:")
                 for mod_file in mod_files[:10]:  # Show first 10
+                    # DirEntry.stat() is cached on the entry
                     size_mb = mod_file.stat().st_size / (1024 * 1024)
                     print(f"   • {mod_file.name} ({size_mb:.1f} MB)")
 
@@ -4,10 +4,15 @@ Pydantic 模型使用示例
 """
 
 import asyncio
+from collections import defaultdict, deque
+from operator import attrgetter
 from pathlib import Path
 from datetime import datetime
 from uuid import uuid4
 
+from pydantic import TypeAdapter
+from typing_extensions import TypedDict
+
 # 從 models 包導入所有模型
 from launcher_core.models import (
     MinecraftOptions,
@@ -24,6 +29,28 @@ from launcher_core.models import (
 )
 
 
+class ExportedConfig(TypedDict):
+    """export_config 的輸出結構"""
+
+    settings: LauncherSettings
+    profiles: list[LaunchProfile]
+    servers: list[ServerInfo]
+    mods: list[ModInfo]
+
+
+# 預設目錄：在導入時計算一次，避免每次呼叫重新查詢家目錄
+_HOME = Path.home()
+_DEFAULT_MC_DIR = str(_HOME / ".minecraft")
+_DEFAULT_GAMES_DIR = str(_HOME / "Games" / "Minecraft")
+
+# 導出序列化器：在導入時建立一次，整份配置在一次呼叫內完成序列化
+_EXPORT_ADAPTER = TypeAdapter(ExportedConfig)
+
+# 篩選用的屬性讀取器
+_AUTO_CONNECT = attrgetter("auto_connect")
+_SIZE = attrgetter("size")
+
+
 def create_minecraft_options_example():
     """創建 MinecraftOptions 示例"""
     print("=== MinecraftOptions 使用示例 ===")
@@ -32,7 +59,7 @@ def create_minecraft_options_example():
     minecraft_opts = MinecraftOptions(
         username="TestPlayer",
         uuid="550e8400-e29b-41d4-a716-446655440000",
-        gameDirectory=str(Path.home() / ".minecraft"),
+        gameDirectory=_DEFAULT_MC_DIR,
         jvmArguments=["-Xmx4G", "-Xms2G", "-XX:+UseG1GC"],
         launcherName="MyCustomLauncher",
         launcherVersion="2.0.0",
@@ -81,7 +108,7 @@ def create_launch_profile_example():
     # 創建 Minecraft 選項
     minecraft_opts = MinecraftOptions(
         username="ProfileUser",
-        gameDirectory=str(Path.home() / "Games" / "Minecraft"),
+        gameDirectory=_DEFAULT_GAMES_DIR,
         jvmArguments=["-Xmx8G", "-Xms4G"],
     )
 
@@ -94,7 +121,7 @@ def create_launch_profile_example():
     profile = LaunchProfile(
         name="我的遊戲設定檔",
         version="1.20.1",
-        game_directory=str(Path.home() / "Games" / "Minecraft"),
+        game_directory=_DEFAULT_GAMES_DIR,
         java_executable="/usr/bin/java",
         jvm_arguments=["-Xmx8G", "-Xms4G", "-XX:+UseG1GC"],
         game_arguments=["--demo"],
@@ -240,7 +267,8 @@ def create_download_info_example():
         ),
     ]
 
-    total_size = sum(dl.size for dl in downloads if dl.size)
+    # filter(None, ...) 略過未知 (None) 的大小，整個加總在 C 層完成
+    total_size = sum(filter(None, map(_SIZE, downloads)))
     print(f"總下載大小: {total_size / 1024 / 1024:.2f} MB")
 
     for dl in downloads:
@@ -306,6 +334,11 @@ class LauncherApplication:
         self.profiles = []
         self.servers = []
         self.mods = []
+        # 已啟用模組的索引，由 add_mod / set_mod_enabled 維護
+        self._enabled_mods: list[ModInfo] = []
+        self._mod_by_id: dict[str, ModInfo] = {}
+        # 依賴排序後的載入順序，新增模組時失效
+        self._mod_load_order: list[str] | None = None
         self.java_installations = []
 
     def add_profile(self, profile: LaunchProfile):
@@ -321,25 +354,78 @@ class LauncherApplication:
     def add_mod(self, mod: ModInfo):
         """添加模組"""
         self.mods.append(mod)
+        self._mod_by_id[mod.id] = mod
+        self._mod_load_order = None
+        if mod.enabled:
+            self._enabled_mods.append(mod)
         print(f"✅ 已添加模組: {mod.name}")
 
+    def set_mod_enabled(self, mod_id: str, enabled: bool) -> None:
+        """啟用或停用模組，並同步更新已啟用索引"""
+        mod = self._mod_by_id[mod_id]
+        if mod.enabled == enabled:
+            return
+        mod.enabled = enabled
+        if enabled:
+            self._enabled_mods.append(mod)
+        else:
+            self._enabled_mods.remove(mod)
+
     def get_enabled_mods(self) -> list[ModInfo]:
         """獲取已啟用的模組"""
-        return [mod for mod in self.mods if mod.enabled]
+        return list(self._enabled_mods)
+
+    def get_mod_load_order(self) -> list[str]:
+        """獲取依賴排序後的模組載入順序"""
+        if self._mod_load_order is None:
+            self._mod_load_order = self._rebuild_mod_graph()
+        return list(self._mod_load_order)
+
+    def _rebuild_mod_graph(self) -> list[str]:
+        # Kahn 演算法：依賴的模組排在前面；不在列表中的依賴（如 forge）視為外部依賴
+        dependents: defaultdict[str, list[str]] = defaultdict(list)
+        in_degree = {mod_id: 0 for mod_id in self._mod_by_id}
+        for mod_id, mod in self._mod_by_id.items():
+            for dependency in mod.dependencies:
+                if dependency in in_degree:
+                    dependents[dependency].append(mod_id)
+                    in_degree[mod_id] += 1
+
+        queue = deque(mod_id for mod_id, degree in in_degree.items() if not degree)
+        order = []
+        while queue:
+            mod_id = queue.popleft()
+            order.append(mod_id)
+            for dependent in dependents[mod_id]:
+                in_degree[dependent] -= 1
+                if not in_degree[dependent]:
+                    queue.append(dependent)
+
+        if len(order) != len(in_degree):
+            cyclic = sorted(mod_id for mod_id, degree in in_degree.items() if degree)
+            raise ValueError(f"模組依賴存在循環: {', '.join(cyclic)}")
+        return order
 
     def get_auto_connect_servers(self) -> list[ServerInfo]:
         """獲取自動連接的伺服器"""
-        return [server for server in self.servers if server.auto_connect]
+        return list(filter(_AUTO_CONNECT, self.servers))
 
-    def export_config(self) -> dict:
-        """導出配置"""
+    def _export_data(self) -> ExportedConfig:
         return {
-            "settings": self.settings.model_dump(),
-            "profiles": [p.model_dump() for p in self.profiles],
-            "servers": [s.model_dump() for s in self.servers],
-            "mods": [m.model_dump() for m in self.mods],
+            "settings": self.settings,
+            "profiles": self.profiles,
+            "servers": self.servers,
+            "mods": self.mods,
         }
 
+    def export_config(self) -> dict:
+        """導出配置"""
+        return _EXPORT_ADAPTER.dump_python(self._export_data())
+
+    def export_config_json(self) -> bytes:
+        """直接導出為 JSON，不經過中間的 Python 字典"""
+        return _EXPORT_ADAPTER.dump_json(self._export_data())
+
 
 def main():
     """主函數 - 運行所有示例"""
@@ -379,6 +465,7 @@ def main():
     print(f"伺服器數量: {len(app.servers)}")
     print(f"模組數量: {len(app.mods)}")
     print(f"已啟用模組: {len(app.get_enabled_mods())}")
+    print(f"模組載入順序: {' -> '.join(app.get_mod_load_order())}")
     print(f"自動連接伺服器: {len(app.get_auto_connect_servers())}")
 
     # 導出配置示例
@@ -8,10 +8,108 @@ from .models import (
     ServerInfo,
     ModInfo,
 )
-from pydantic import BaseModel, Field, ConfigDict, validator
-from typing import Optional, List, Dict
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr, field_validator
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    Optional,
+    List,
+    Dict,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+from contextlib import contextmanager
 from pathlib import Path
+import aiohttp
+import asyncio
+import dataclasses
 import datetime
+import hashlib
+import os
+import time
+import types
+
+# 帳戶擁有權檢查結果的快取：token 的 SHA-256 -> (過期時間, 結果)
+# 只保存雜湊值，避免在記憶體中保留原始 token
+_OWNERSHIP_CACHE: Dict[str, Tuple[float, bool]] = {}
+_OWNERSHIP_TTL = 300
+
+
+# 每個模型預先編譯好的可信載入函式，依 schema 只分析一次欄位型別
+_TRUSTED_BUILDERS: Dict[type, Callable[[Dict[str, Any]], BaseModel]] = {}
+
+
+def _compile_value(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """依欄位型別產生把巢狀字典轉回模型的函式；不需轉換的型別回傳 None"""
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is None and isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            # 延遲查找，讓自我參照的模型也能編譯
+            return lambda value: (
+                _trusted_builder(annotation)(value)
+                if isinstance(value, dict)
+                else value
+            )
+        if dataclasses.is_dataclass(annotation):
+            return lambda value: (
+                annotation(**value) if isinstance(value, dict) else value
+            )
+        return None
+
+    if origin is Union or origin is types.UnionType:
+        for arg in args:
+            if arg is not type(None):
+                return _compile_value(arg)
+    elif origin is list and args:
+        item = _compile_value(args[0])
+        if item is not None:
+            return lambda value: (
+                [item(v) for v in value] if isinstance(value, list) else value
+            )
+    elif origin is dict and len(args) == 2:
+        item = _compile_value(args[1])
+        if item is not None:
+            return lambda value: (
+                {k: item(v) for k, v in value.items()}
+                if isinstance(value, dict)
+                else value
+            )
+    return None
+
+
+def _trusted_builder(model: type[BaseModel]) -> Callable[[Dict[str, Any]], BaseModel]:
+    """取得（必要時編譯）模型的可信載入函式"""
+    builder = _TRUSTED_BUILDERS.get(model)
+    if builder is not None:
+        return builder
+
+    # 只保留需要轉換的欄位，純量欄位直接沿用原值
+    converters: Dict[str, Callable[[Any], Any]] = {}
+    for name, field in model.model_fields.items():
+        convert = _compile_value(field.annotation)
+        if convert is not None:
+            converters[name] = convert
+    construct = model.model_construct
+    items = tuple(converters.items())
+
+    def builder(data: Dict[str, Any]) -> BaseModel:
+        values = dict(data)
+        for name, convert in items:
+            if name in values:
+                values[name] = convert(values[name])
+        return construct(**values)
+
+    _TRUSTED_BUILDERS[model] = builder
+    return builder
+
+
+def _construct_trusted(model: type[BaseModel], data: Dict[str, Any]) -> BaseModel:
+    """遞迴地以 model_construct 建立模型，跳過所有驗證"""
+    return _trusted_builder(model)(data)
 
 
 class MultipleCredential(BaseModel):
@@ -29,19 +127,37 @@ class AccountManager:
     """
 
     @staticmethod
-    async def Checker(Credential: AuthCredential) -> bool:
+    async def Checker(
+        Credential: AuthCredential, session: Optional[aiohttp.ClientSession] = None
+    ) -> bool:
         """
         檢查帳戶憑證是否有效
+
+        :param session: 可選的共用 aiohttp 連線，未提供時會建立臨時連線
         """
         if not Credential.access_token:
             raise NeedAccountInfo("帳戶憑證無效或未提供")
 
         access_token = Credential.access_token
+        key = hashlib.sha256(access_token.encode()).hexdigest()
+        cached = _OWNERSHIP_CACHE.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
         try:
-            await have_minecraft(access_token)
+            await have_minecraft(access_token, session=session)
+            owns_minecraft = True
         except AccountNotOwnMinecraft:
-            return False
-        return True
+            owns_minecraft = False
+
+        now = time.monotonic()
+        # 清除已過期的項目，避免快取無限增長
+        expired = [k for k, (expiry, _) in _OWNERSHIP_CACHE.items() if expiry <= now]
+        for stale in expired:
+            del _OWNERSHIP_CACHE[stale]
+        ttl = min(Credential.expires_in or _OWNERSHIP_TTL, _OWNERSHIP_TTL)
+        _OWNERSHIP_CACHE[key] = (now + ttl, owns_minecraft)
+        return owns_minecraft
 
     @staticmethod
     async def MultipleChecker(MultipleCredential: MultipleCredential) -> bool:
@@ -51,10 +167,23 @@ class AccountManager:
         if not MultipleCredential.AuthCredential:
             raise NeedAccountInfo("沒有提供任何帳戶憑證")
 
-        for credential in MultipleCredential.AuthCredential:
-            if not await AccountManager.Checker(credential):
-                return False
-        return True
+        # 所有檢查共用同一個連線池，只需進行一次 TLS 握手
+        async with aiohttp.ClientSession() as session:
+            # 並發檢查所有憑證，先完成的先處理
+            tasks = [
+                asyncio.create_task(AccountManager.Checker(credential, session))
+                for credential in MultipleCredential.AuthCredential
+            ]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    if not await next_done:
+                        return False
+                return True
+            finally:
+                # 一旦有憑證無效或出錯，取消其餘仍在進行的檢查
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
 
 
 class LauncherConfigModel(BaseModel):
@@ -110,29 +239,52 @@ class LauncherConfigModel(BaseModel):
         default_factory=list, description="已安裝的模組列表"
     )
 
-    @validator(
+    # 目錄欄位名稱 -> (原始值, 解析後的絕對路徑)
+    _resolved_dirs: Dict[str, Tuple[str, str]] = PrivateAttr(default_factory=dict)
+
+    @field_validator(
         "minecraft_directory",
         "config_directory",
         "cache_directory",
         "logs_directory",
-        pre=True,
+        mode="before",
     )
+    @classmethod
     def validate_directories(cls, v):
         """驗證目錄路徑"""
+        # 只展開 ~，不在每次賦值時存取檔案系統；需要絕對路徑時使用 resolved_directory
         if v is not None:
-            path = Path(v).expanduser().resolve()
-            return str(path)
+            return os.path.expanduser(os.fspath(v))
         return v
 
+    def resolved_directory(self, name: str) -> Optional[str]:
+        """
+        取得目錄欄位解析後的絕對路徑
+
+        結果會依目前的值快取，目錄被修改後會重新解析
+        """
+        value = getattr(self, name)
+        if value is None:
+            return None
+        cached = self._resolved_dirs.get(name)
+        if cached is None or cached[0] != value:
+            cached = (value, str(Path(value).resolve()))
+            self._resolved_dirs[name] = cached
+        return cached[1]
+
+    @property
+    def minecraft_directory_resolved(self) -> Optional[str]:
+        """Minecraft 安裝目錄的絕對路徑"""
+        return self.resolved_directory("minecraft_directory")
+
 
 class GameProfileConfig(BaseModel):
     """
     遊戲設定檔配置模型
     """
 
-    model_config = ConfigDict(
-        extra="forbid", validate_assignment=True, str_strip_whitespace=True
-    )
+    # 讀多寫少的配置凍結為不可變，修改時透過 model_copy(update=...) 建立新實例
+    model_config = ConfigDict(extra="forbid", frozen=True, str_strip_whitespace=True)
 
     # 基本信息
     profile_id: str = Field(..., description="設定檔 ID")
@@ -182,7 +334,7 @@ class DownloadConfig(BaseModel):
     下載配置模型
     """
 
-    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     # 下載設定
     max_concurrent_downloads: int = Field(
@@ -214,7 +366,7 @@ class UIConfig(BaseModel):
     用戶界面配置模型
     """
 
-    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     # 窗口設定
     window_width: int = Field(default=1200, description="窗口寬度", ge=800)
@@ -283,6 +435,40 @@ class CompleteLauncherConfig(BaseModel):
         default_factory=datetime.datetime.now, description="最後修改時間"
     )
 
+    # 批量編輯期間暫停更新 last_modified
+    _suspend_ts: bool = PrivateAttr(default=False)
+
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> "CompleteLauncherConfig":
+        """
+        從已驗證過的資料（例如自己保存的配置）快速建立配置
+
+        使用 model_construct 遞迴建立所有子配置，不重新驗證；
+        使用者輸入請改用 model_validate
+        """
+        return _construct_trusted(cls, data)
+
+    @contextmanager
+    def bulk_edit(self) -> Iterator["CompleteLauncherConfig"]:
+        """
+        批量修改設定檔，結束時只更新一次 last_modified
+
+        with config.bulk_edit():
+            for profile in profiles:
+                config.add_profile(profile)
+        """
+        self._suspend_ts = True
+        try:
+            yield self
+        finally:
+            self._suspend_ts = False
+            self.last_modified = datetime.datetime.now()
+
+    def _touch(self) -> None:
+        """更新最後修改時間（批量編輯時延後到結束）"""
+        if not self._suspend_ts:
+            self.last_modified = datetime.datetime.now()
+
     def get_active_profile(self) -> Optional[GameProfileConfig]:
         """獲取當前活躍的設定檔"""
         if self.active_profile_id and self.active_profile_id in self.game_profiles:
@@ -294,7 +480,7 @@ class CompleteLauncherConfig(BaseModel):
         self.game_profiles[profile.profile_id] = profile
         if not self.active_profile_id:
             self.active_profile_id = profile.profile_id
-        self.last_modified = datetime.datetime.now()
+        self._touch()
 
     def remove_profile(self, profile_id: str) -> bool:
         """移除遊戲設定檔"""
@@ -303,7 +489,7 @@ class CompleteLauncherConfig(BaseModel):
             if self.active_profile_id == profile_id:
                 # 設置新的活躍設定檔
                 self.active_profile_id = next(iter(self.game_profiles.keys()), None)
-            self.last_modified = datetime.datetime.now()
+            self._touch()
             return True
         return False
 
@@ -334,10 +520,31 @@ class MinecraftLauncher:
         """獲取完整配置"""
         return self.config
 
+    def load_config(self, data: Dict[str, Any], trusted: bool = False) -> None:
+        """
+        從字典載入完整配置
+
+        trusted 為 True 時跳過驗證，只應用於啟動器自己保存的配置
+        """
+        if trusted:
+            self.config = CompleteLauncherConfig.from_trusted_dict(data)
+        else:
+            self.config = CompleteLauncherConfig.model_validate(data)
+
     def update_config(self, **kwargs) -> None:
-        """更新配置"""
+        """
+        更新配置
+
+        子配置（如 ui_config）可傳入字典，只更新其中的欄位
+        """
         for key, value in kwargs.items():
             if hasattr(self.config, key):
+                current = getattr(self.config, key)
+                if isinstance(current, BaseModel) and isinstance(value, dict):
+                    # 重新驗證合併後的欄位，凍結的子配置不會在賦值時再次驗證
+                    value = type(current).model_validate(
+                        {**current.model_dump(), **value}
+                    )
                 setattr(self.config, key, value)
         self.config.last_modified = datetime.datetime.now()
 
@@ -4,31 +4,59 @@
 
 __version__ = "0.4-rc"
 
+import importlib
+from typing import Any
+
 from .logging_utils import logger
 from .check_version import check_version
-from .config.load_launcher_config import ConfigManager, LauncherConfig
 
 # 導入 Pydantic 模型
 from .models.auth import MinecraftUUID, Credential, AzureApplication
 
-from . import (
-    command,
-    install,
-    microsoft_account,
-    utils,
-    java_utils,
-    forge,
-    fabric,
-    quilt,
-    news,
-    runtime,
-    mrpack,
-    exceptions,
-    microsoft_types,
-    config,
+# 子模組與較重的名稱在第一次存取時才導入 (PEP 562)，
+# 讓只需要部分功能的程式不必承擔整個啟動器的導入成本
+_LAZY_MODULES = frozenset(
+    {
+        "command",
+        "install",
+        "microsoft_account",
+        "utils",
+        "java_utils",
+        "forge",
+        "fabric",
+        "quilt",
+        "news",
+        "runtime",
+        "mrpack",
+        "exceptions",
+        "models",
+        "microsoft_types",
+        "config",
+    }
 )
-from .utils import sync
-from .mojang import verify_mojang_jwt
+_LAZY_ATTRS = {
+    "ConfigManager": ".config.load_launcher_config",
+    "LauncherConfig": ".config.load_launcher_config",
+    "sync": ".utils",
+    "verify_mojang_jwt": ".mojang",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_MODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # 快取結果，之後的存取不再經過 __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "command",
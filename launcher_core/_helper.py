@@ -4,6 +4,7 @@
 """This module contains some helper functions. It should not be used outside minecraft_launcher_lib"""
 
 from typing import Literal, Any, NoReturn
+import asyncio
 import subprocess
 import datetime
 import platform
@@ -14,8 +15,15 @@ import json
 import sys
 import re
 import os
+import uuid
 import aiohttp
 import aiofiles
+
+try:
+    import orjson  # 可選依賴，用於加速 JSON 解析
+except ImportError:
+    orjson = None
+
 from .exceptions import FileOutsideMinecraftDirectory, InvalidChecksum, VersionNotFound
 from ._internal_types.shared_types import ClientJson, ClientJsonRule, ClientJsonLibrary
 from ._internal_types.helper_types import RequestsResponseCache, MavenMetadata
@@ -32,6 +40,16 @@ else:
     SUBPROCESS_STARTUP_INFO = None
 
 
+def json_loads(data: str | bytes) -> Any:
+    """
+    Parses JSON with orjson if it is installed, otherwise with the json module.
+    Used for the large version and asset index files.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def empty(arg: Any) -> NoReturn:
     """
     This function is just a placeholder
@@ -87,6 +105,9 @@ async def download_file(
         session = aiohttp.ClientSession()
         close_session = True
 
+    # 先寫入唯一的暫存檔，校驗後再以 os.replace 原子地取代目標檔案，
+    # 讓同時安裝的多個版本寫入同一個共用檔案時不會互相截斷或讀到寫了一半的檔案
+    tmp_path = f"{path}.{uuid.uuid4().hex}.part"
     try:
         headers = {"user-agent": await get_user_agent()}  # Await the async function
         async with session.get(
@@ -99,10 +120,11 @@ async def download_file(
             if content_length:
                 content_length = int(content_length)
 
-            async with aiofiles.open(path, "wb") as f:
+            async with aiofiles.open(tmp_path, "wb") as f:
                 if lzma_compressed:
                     content = await r.read()
-                    await f.write(lzma.decompress(content))
+                    # Decompressing is CPU bound, keep it off the event loop
+                    await f.write(await asyncio.to_thread(lzma.decompress, content))
                 else:
                     # Optimized streaming download with larger chunks and progress tracking
                     chunk_size = 1024 * 1024  # Increased to 1MB for better performance
@@ -116,14 +138,18 @@ async def download_file(
                         # Update progress if callback provided
                         if progress_callback and content_length:
                             progress_callback(content_length, downloaded)
+
+        if sha1 is not None:
+            checksum = await get_sha1_hash(tmp_path)
+            if checksum != sha1:
+                raise InvalidChecksum(url, path, sha1, checksum)
+
+        os.replace(tmp_path, path)
     finally:
         if close_session:
             await session.close()
-
-    if sha1 is not None:
-        checksum = await get_sha1_hash(path)
-        if checksum != sha1:
-            raise InvalidChecksum(url, path, sha1, checksum)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
     return True
 
@@ -218,7 +244,7 @@ async def inherit_json(
         path, "versions", inherit_version, inherit_version + ".json"
     )
     async with aiofiles.open(file_path, "r") as f:
-        new_data: ClientJson = json.loads(await f.read())
+        new_data: ClientJson = json_loads(await f.read())
 
     # Inheriting the libs is a bit special
     # If the lib is already present in the client.json in a different, it can't be inherited
@@ -354,13 +380,17 @@ def get_classpath_separator() -> Literal[":", ";"]:
 _requests_response_cache: dict[str, RequestsResponseCache] = {}
 
 
-async def get_requests_response_cache(url: str) -> aiohttp.ClientResponse:
+async def get_requests_response_cache(
+    url: str, session: aiohttp.ClientSession | None = None
+) -> aiohttp.ClientResponse:
     """
     Caches the result of request.get(). If a request was made to the same URL within the last hour,
     the cache will be used, so you don't need to make a request to a URL each time you call a function.
 
     Args:
         url: The URL to request or get from cache
+        session: An existing session to reuse its connection pool. A temporary
+            session is created if not given
 
     Returns:
         A dictionary containing cached response data
@@ -374,48 +404,55 @@ async def get_requests_response_cache(url: str) -> aiohttp.ClientResponse:
             return cache_entry["response"]
 
     # Make new request if cache expired or missing
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            url, headers={"user-agent": await get_user_agent()}
-        ) as r:
-            if r.status == 200:
-                # Copy response data to avoid connection closed issues
-                content = await r.read()
-                text = await r.text()
-                json_data = (
-                    await r.json()
-                    if "application/json" in r.headers.get("Content-Type", "")
-                    else None
-                )
-
-                # Create a response cache object
-                response_cache = {
-                    "status": r.status,
-                    "content": content,
-                    "text": text,
-                    "json_data": json_data,
-                    "headers": dict(r.headers),
-                }
-
-                # Update cache (with simple size limit)
-                if len(_requests_response_cache) > 100:  # Keep max 100 entries
-                    _requests_response_cache.clear()
-
-                _requests_response_cache[url] = {
-                    "response": response_cache,
-                    "datetime": now,
-                }
-                return response_cache
-
-            # Handle non-200 responses
-            return {
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await _fetch_response_cache(url, session, now)
+    return await _fetch_response_cache(url, session, now)
+
+
+async def _fetch_response_cache(
+    url: str, session: aiohttp.ClientSession, now: datetime.datetime
+) -> dict:
+    """Requests the URL and stores successful responses in the cache"""
+    async with session.get(url, headers={"user-agent": await get_user_agent()}) as r:
+        if r.status == 200:
+            # Copy response data to avoid connection closed issues
+            content = await r.read()
+            text = await r.text()
+            json_data = (
+                await r.json()
+                if "application/json" in r.headers.get("Content-Type", "")
+                else None
+            )
+
+            # Create a response cache object
+            response_cache = {
                 "status": r.status,
-                "content": await r.read(),
-                "text": await r.text(),
-                "json_data": None,
+                "content": content,
+                "text": text,
+                "json_data": json_data,
                 "headers": dict(r.headers),
             }
 
+            # Update cache (with simple size limit)
+            if len(_requests_response_cache) > 100:  # Keep max 100 entries
+                _requests_response_cache.clear()
+
+            _requests_response_cache[url] = {
+                "response": response_cache,
+                "datetime": now,
+            }
+            return response_cache
+
+        # Handle non-200 responses
+        return {
+            "status": r.status,
+            "content": await r.read(),
+            "text": await r.text(),
+            "json_data": None,
+            "headers": dict(r.headers),
+        }
+
 
 async def parse_maven_metadata(url: str) -> MavenMetadata:
     """
@@ -477,7 +514,7 @@ async def get_client_json(
     )
     if os.path.isfile(local_path):
         async with aiofiles.open(local_path, "r", encoding="utf-8") as f:
-            data = json.loads(await f.read())
+            data = json_loads(await f.read())
 
         if "inheritsFrom" in data:
             data = await inherit_json(data, minecraft_directory)
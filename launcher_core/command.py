@@ -3,13 +3,13 @@
 # SPDX-License-Identifier: BSD-2-Clause
 """command contains the function for creating the minecraft command"""
 
-import json
 import copy
 import os
 import aiofiles
 from ._helper import (
     parse_rule_list,
     inherit_json,
+    json_loads,
     get_classpath_separator,
     get_library_path,
 )
@@ -208,7 +208,7 @@ class MinecraftCommandBuilder:
             self.path, "versions", self.version, self.version + ".json"
         )
         async with aiofiles.open(json_path, "r", encoding="utf-8") as f:
-            self.data = json.loads(await f.read())
+            self.data = json_loads(await f.read())
 
         if "inheritsFrom" in self.data:
             self.data = await inherit_json(self.data, self.path)
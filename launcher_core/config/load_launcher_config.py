@@ -8,9 +8,11 @@ Enhanced with automatic environment variable support and type validation.
 # SPDX-License-Identifier: BSD-2-Clause
 
 # 標準庫導入
+import json
 import os
+import uuid
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Mapping, Optional, Union, get_args
 
 # 兼容 Python 3.10 的 tomllib 導入
 try:
@@ -20,7 +22,7 @@ except ImportError:
 
 from tomli_w import dumps
 import aiofiles
-from pydantic import Field
+from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from ..models import MinecraftOptions
 
@@ -120,6 +122,76 @@ class LauncherConfig(BaseSettings):
         default=None, description="快速 Realms 遊戲"
     )
 
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> "LauncherConfig":
+        """
+        只掃描一次環境變量來創建配置
+
+        與直接調用 ``LauncherConfig()`` 相比，只收集 ``MC_LAUNCHER_`` 前綴的變量，
+        不會逐個字段查詢環境變量，適合需要反覆創建配置的場景。
+
+        Args:
+            environ: 環境變量映射，默認為 ``os.environ``
+
+        Returns:
+            LauncherConfig: 從環境變量創建的配置對象
+        """
+        prefix = cls.model_config["env_prefix"].upper()
+        delimiter = cls.model_config["env_nested_delimiter"]
+        prefix_len = len(prefix)
+
+        data: dict[str, Any] = {}
+        for key, value in (os.environ if environ is None else environ).items():
+            if not key.upper().startswith(prefix):
+                continue
+            *parents, leaf = key[prefix_len:].lower().split(delimiter)
+            target = data
+            for part in parents:
+                target = target.setdefault(part, {})
+            target[leaf] = _parse_env_value(value)
+
+        # 直接進行模型驗證，跳過 BaseSettings 的配置源（環境變量已在上面讀取）
+        config = cls.__new__(cls)
+        BaseModel.__init__(config, **_match_field_names(cls, data))
+        return config
+
+
+def _parse_env_value(value: str) -> Any:
+    """與 pydantic-settings 一致，列表和字典類型的值以 JSON 形式提供"""
+    if value[:1] in ("[", "{"):
+        try:
+            return json.loads(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _nested_model(annotation: Any) -> Optional[type[BaseModel]]:
+    """從 Optional[Model] 等註解中取出 Pydantic 模型類型"""
+    for candidate in (annotation, *get_args(annotation)):
+        if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+            return candidate
+    return None
+
+
+def _match_field_names(model: type[BaseModel], data: dict[str, Any]) -> dict[str, Any]:
+    """將小寫的環境變量鍵映射回模型的字段名（例如 gamedirectory -> gameDirectory）"""
+    lookup = {}
+    for name, field in model.model_fields.items():
+        lookup[name.lower()] = (name, field)
+        if field.alias:
+            lookup[field.alias.lower()] = (name, field)
+
+    matched = {}
+    for key, value in data.items():
+        name, field = lookup.get(key, (key, None))
+        if field is not None and isinstance(value, dict):
+            nested = _nested_model(field.annotation)
+            if nested is not None:
+                value = _match_field_names(nested, value)
+        matched[name] = value
+    return matched
+
 
 class ConfigManager:
     """配置管理器，提供加載和保存配置的功能"""
@@ -127,6 +199,8 @@ class ConfigManager:
     def __init__(self, config_path: Union[str, os.PathLike] = "config.toml"):
         self.config_path = Path(config_path)
         self._config: Optional[LauncherConfig] = None
+        # 以 update_config(flush=False) 延後寫入的更新，flush() 時才寫入文件
+        self._dirty = False
 
     async def load_config(self, reload: bool = False) -> LauncherConfig:
         """
@@ -153,6 +227,7 @@ class ConfigManager:
             else:
                 # 如果文件不存在，只從環境變量加載
                 self._config = LauncherConfig()
+            self._dirty = False
 
         return self._config
 
@@ -177,15 +252,27 @@ class ConfigManager:
         # 確保目錄存在
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # 寫入文件
-        async with aiofiles.open(self.config_path, mode="w", encoding="utf-8") as f:
+        # 先寫入臨時文件再替換，避免寫入中斷時損壞配置文件
+        # 暫存檔名唯一，避免同時保存時互相覆蓋
+        tmp_path = self.config_path.with_name(
+            f"{self.config_path.name}.{uuid.uuid4().hex}.part"
+        )
+        async with aiofiles.open(tmp_path, mode="w", encoding="utf-8") as f:
             await f.write(toml_str)
+        os.replace(tmp_path, self.config_path)
+
+        if config is self._config:
+            self._dirty = False
 
-    async def update_config(self, **kwargs) -> LauncherConfig:
+    async def update_config(self, *, flush: bool = True, **kwargs) -> LauncherConfig:
         """
         更新配置
 
+        默認每次更新後立即寫入文件。連續多次更新時可傳入 ``flush=False``
+        只修改內存中的配置，最後調用一次 :meth:`flush` 保存，避免重複序列化和寫入。
+
         Args:
+            flush: 是否立即寫入文件
             **kwargs: 要更新的配置項
 
         Returns:
@@ -197,12 +284,24 @@ class ConfigManager:
         for key, value in kwargs.items():
             if hasattr(config, key):
                 setattr(config, key, value)
+                self._dirty = True
 
-        # 保存配置
-        await self.save_config(config)
+        if flush:
+            # 保存配置
+            await self.save_config(config)
 
         return config
 
+    async def flush(self) -> None:
+        """如果有未保存的更新，將當前配置寫入 TOML 文件"""
+        if self._dirty:
+            await self.save_config()
+
+    @property
+    def dirty(self) -> bool:
+        """是否有尚未寫入文件的更新"""
+        return self._dirty
+
     def get_config(self) -> Optional[LauncherConfig]:
         """獲取當前加載的配置（同步方法）"""
         return self._config
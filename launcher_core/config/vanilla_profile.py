@@ -24,6 +24,7 @@ from launcher_core._internal_types.vanilla_launcher_types import (
     VanillaLauncherProfilesJsonProfile,
 )
 from launcher_core.models.minecraft import VanillaLauncherProfile, MinecraftOptions
+from launcher_core._helper import json_loads
 from launcher_core.exceptions import InvalidVanillaLauncherProfile
 from launcher_core.utils import get_latest_version
 
@@ -140,7 +141,7 @@ class ProfileFileHandler:
         try:
             async with aiofiles.open(self.profiles_path, "r", encoding="utf-8") as file:
                 content = await file.read()
-                return json.loads(content)
+                return json_loads(content)
         except FileNotFoundError:
             raise FileNotFoundError(
                 f"Launcher profiles file not found: {self.profiles_path}"
@@ -6,6 +6,7 @@
 import asyncio
 import tempfile
 import os
+import aiohttp
 from ._helper import (
     download_file,
     get_requests_response_cache,
@@ -18,7 +19,9 @@ from .install import install_minecraft_version
 from .utils import is_version_valid
 
 
-async def get_all_minecraft_versions() -> list[FabricMinecraftVersion]:
+async def get_all_minecraft_versions(
+    session: aiohttp.ClientSession | None = None,
+) -> list[FabricMinecraftVersion]:
     """
     Returns all available Minecraft Versions for Fabric
 
@@ -28,12 +31,18 @@ async def get_all_minecraft_versions() -> list[FabricMinecraftVersion]:
 
         for version in await launcher_corefabric.get_all_minecraft_versions():
             print(version["version"])
+
+    :param session: An optional :class:`aiohttp.ClientSession` to reuse
     """
     FABRIC_MINECARFT_VERSIONS_URL = "https://meta.fabricmc.net/v2/versions/game"
-    return await get_requests_response_cache(FABRIC_MINECARFT_VERSIONS_URL)
+    return await get_requests_response_cache(
+        FABRIC_MINECARFT_VERSIONS_URL, session=session
+    )
 
 
-async def get_stable_minecraft_versions() -> list[str]:
+async def get_stable_minecraft_versions(
+    session: aiohttp.ClientSession | None = None,
+) -> list[str]:
     """
     Returns a list which only contains the stable Minecraft versions that supports Fabric
 
@@ -43,8 +52,10 @@ async def get_stable_minecraft_versions() -> list[str]:
 
         for version in await launcher_corefabric.get_stable_minecraft_versions():
             print(version)
+
+    :param session: An optional :class:`aiohttp.ClientSession` to reuse
     """
-    minecraft_versions = await get_all_minecraft_versions()
+    minecraft_versions = await get_all_minecraft_versions(session=session)
     stable_versions = []
     for i in minecraft_versions:
         if i["stable"] is True:
@@ -52,7 +63,9 @@ async def get_stable_minecraft_versions() -> list[str]:
     return stable_versions
 
 
-async def get_latest_minecraft_version() -> str:
+async def get_latest_minecraft_version(
+    session: aiohttp.ClientSession | None = None,
+) -> str:
     """
     Returns the latest unstable Minecraft versions that supports Fabric. This could be a snapshot.
 
@@ -61,12 +74,16 @@ async def get_latest_minecraft_version() -> str:
     .. code:: python
 
         print("Latest Minecraft version: " + await launcher_corefabric.get_latest_minecraft_version())
+
+    :param session: An optional :class:`aiohttp.ClientSession` to reuse
     """
-    minecraft_versions = await get_all_minecraft_versions()
+    minecraft_versions = await get_all_minecraft_versions(session=session)
     return minecraft_versions[0]["version"]
 
 
-async def get_latest_stable_minecraft_version() -> str:
+async def get_latest_stable_minecraft_version(
+    session: aiohttp.ClientSession | None = None,
+) -> str:
     """
     Returns the latest stable Minecraft version that supports Fabric
 
@@ -75,12 +92,16 @@ async def get_latest_stable_minecraft_version() -> str:
     .. code:: python
 
         print("Latest stable Minecraft version: " + await launcher_corefabric.get_latest_stable_minecraft_version())
+
+    :param session: An optional :class:`aiohttp.ClientSession` to reuse
     """
-    stable_versions = await get_stable_minecraft_versions()
+    stable_versions = await get_stable_minecraft_versions(session=session)
     return stable_versions[0]
 
 
-async def is_minecraft_version_supported(version: str) -> bool:
+async def is_minecraft_version_supported(
+    version: str, session: aiohttp.ClientSession | None = None
+) -> bool:
     """
     Checks if a Minecraft version supported by Fabric
 
@@ -95,15 +116,18 @@ async def is_minecraft_version_supported(version: str) -> bool:
             print(f"{version} is not supported by fabric")
 
     :param version: A vanilla version
+    :param session: An optional :class:`aiohttp.ClientSession` to reuse
     """
-    minecraft_versions = await get_all_minecraft_versions()
+    minecraft_versions = await get_all_minecraft_versions(session=session)
     for i in minecraft_versions:
         if i["version"] == version:
             return True
     return False
 
 
-async def get_all_loader_versions() -> list[FabricLoader]:
+async def get_all_loader_versions(
+    session: aiohttp.ClientSession | None = None,
+) -> list[FabricLoader]:
     """
     Returns all loader versions
 
@@ -113,12 +137,18 @@ async def get_all_loader_versions() -> list[FabricLoader]:
 
         for version in await launcher_corefabric.get_all_loader_versions():
             print(version["version"])
+
+    :param session: An optional :class:`aiohttp.ClientSession` to reuse
     """
     FABRIC_LOADER_VERSIONS_URL = "https://meta.fabricmc.net/v2/versions/loader"
-    return await get_requests_response_cache(FABRIC_LOADER_VERSIONS_URL)
+    return await get_requests_response_cache(
+        FABRIC_LOADER_VERSIONS_URL, session=session
+    )
 
 
-async def get_latest_loader_version() -> str:
+async def get_latest_loader_version(
+    session: aiohttp.ClientSession | None = None,
+) -> str:
     """
     Get the latest loader version
 
@@ -127,8 +157,10 @@ async def get_latest_loader_version() -> str:
     .. code:: python
 
         print("Latest loader version: " + await launcher_corefabric.get_latest_loader_version())
+
+    :param session: An optional :class:`aiohttp.ClientSession` to reuse
     """
-    loader_versions = await get_all_loader_versions()
+    loader_versions = await get_all_loader_versions(session=session)
     return loader_versions[0]["version"]
 
 
@@ -24,6 +24,7 @@ from ._helper import (
     empty,
     extract_file_from_zip,
     get_classpath_separator,
+    json_loads,
     SUBPROCESS_STARTUP_INFO,
 )
 from .install import install_minecraft_version, install_libraries
@@ -151,7 +152,7 @@ async def install_forge_version(
         with zf.open("install_profile.json", "r") as f:
             version_content = f.read()
 
-        version_data: ForgeInstallProfile = json.loads(version_content)
+        version_data: ForgeInstallProfile = json_loads(version_content)
         forge_version_id = (
             version_data["version"]
             if "version" in version_data
@@ -4,27 +4,45 @@
 "install allows you to install minecraft."
 
 import shutil
-import json
 import os
 import asyncio
+from typing import AsyncIterator
 import aiohttp
 import aiofiles
+
+try:
+    import ijson  # 可選依賴，用於流式解析版本清單
+except ImportError:
+    ijson = None
+
 from ._helper import (
     download_file,
     parse_rule_list,
     inherit_json,
+    json_loads,
     empty,
     get_user_agent,
     check_path_inside_minecraft_directory,
 )
-from ._internal_types.shared_types import ClientJson, ClientJsonLibrary
+from ._internal_types.shared_types import (
+    ClientJson,
+    ClientJsonLibrary,
+    _VersionListManifestJsonVersion,
+)
 from .natives import extract_natives_file, get_natives
 from ._internal_types.install_types import AssetsJson
 from .runtime import install_jvm_runtime
 from .exceptions import VersionNotFound
 from .models import CallbackDict
 
-__all__ = ["install_minecraft_version"]
+__all__ = ["install_minecraft_version", "iter_version_list"]
+
+VERSION_MANIFEST_URL = (
+    "https://launchermeta.mojang.com/mc/game/version_manifest_v2.json"
+)
+
+# Concurrent library downloads in install_libraries when max_workers is not given
+DEFAULT_LIBRARY_WORKERS = 8
 
 
 async def install_libraries(
@@ -180,42 +198,23 @@ async def install_libraries(
                 i["extract"],
             )
 
-    # Create tasks with proper concurrency control
-    semaphore = asyncio.Semaphore(max_workers or len(libraries))
-
-    async def limited_download(lib: ClientJsonLibrary) -> None:
-        async with semaphore:
-            async with aiohttp.ClientSession() as session:
-                await download_library(lib, session)
-
-    tasks = [asyncio.create_task(limited_download(lib)) for lib in libraries]
-
-    count = 0
-    for task in asyncio.as_completed(tasks):
-        await task
-        count += 1
-        callback.get("setProgress", empty)(count)
-
-    count = 0
-    tasks = []
-    for i in libraries:
-        task = asyncio.create_task(download_library(i))
-        tasks.append(task)
+    # All libraries share one session (and its connection pool); the
+    # semaphore bounds how many downloads run at the same time
+    semaphore = asyncio.Semaphore(max_workers or DEFAULT_LIBRARY_WORKERS)
 
-    # Use semaphore to limit concurrent downloads if max_workers is specified
-    if max_workers:
-        semaphore = asyncio.Semaphore(max_workers)
+    async with aiohttp.ClientSession() as session:
 
-        async def limited_download(lib):
+        async def limited_download(lib: ClientJsonLibrary) -> None:
             async with semaphore:
-                await download_library(lib)
+                await download_library(lib, session)
 
-        tasks = [asyncio.create_task(limited_download(i)) for i in libraries]
+        tasks = [asyncio.create_task(limited_download(lib)) for lib in libraries]
 
-    for task in asyncio.as_completed(tasks):
-        await task
-        count += 1
-        callback.get("setProgress", empty)(count)
+        count = 0
+        for task in asyncio.as_completed(tasks):
+            await task
+            count += 1
+            callback.get("setProgress", empty)(count)
 
 
 async def install_assets(
@@ -246,7 +245,7 @@ async def install_assets(
     async with aiofiles.open(
         os.path.join(path, "assets", "indexes", data["assets"] + ".json"), "r"
     ) as f:
-        assets_data: AssetsJson = json.loads(await f.read())
+        assets_data: AssetsJson = json_loads(await f.read())
 
     # The assets has a hash. e.g. c4dbabc820f04ba685694c63359429b22e3a62b5
     # With this hash, it can be download from https://resources.download.minecraft.net/c4/c4dbabc820f04ba685694c63359429b22e3a62b5
@@ -315,7 +314,7 @@ async def do_version_install(
         "r",
         encoding="utf-8",
     ) as f:
-        versiondata: ClientJson = json.loads(await f.read())
+        versiondata: ClientJson = json_loads(await f.read())
 
     # For Forge
     if "inheritsFrom" in versiondata:
@@ -445,3 +444,35 @@ async def install_minecraft_version(
             )
             return
     raise VersionNotFound(versionid)
+
+
+async def iter_version_list() -> AsyncIterator[_VersionListManifestJsonVersion]:
+    """
+    Yields the entries of Mojang's version manifest one at a time, newest first.
+
+    If `ijson <https://pypi.org/project/ijson/>`_ is installed the response body is parsed
+    incrementally, so a caller that stops iterating early never parses the rest of the manifest.
+    Without ijson the whole manifest is parsed before the first entry is yielded.
+
+    .. code:: python
+
+        async for version in install.iter_version_list():
+            if version["type"] == "release":
+                print(version["id"])
+                break
+    """
+    async with aiohttp.ClientSession(
+        headers={"user-agent": await get_user_agent()}
+    ) as session:
+        async with session.get(VERSION_MANIFEST_URL) as response:
+            response.raise_for_status()
+            if ijson is None:
+                version_list = await response.json()
+                for version in version_list["versions"]:
+                    yield version
+                return
+
+            async for version in ijson.items(
+                response.content, "versions.item", use_float=True
+            ):
+                yield version
@@ -143,28 +143,42 @@ class Skin:
                 return response.status == 204
 
 
-async def have_minecraft(access_token: str, check: bool = True) -> bool:
+async def have_minecraft(
+    access_token: str,
+    check: bool = True,
+    session: aiohttp.ClientSession | None = None,
+) -> bool:
     """
     Check if the user owns Minecraft using the access token.
 
     :param access_token: The Minecraft access token
+    :param session: An optional :class:`aiohttp.ClientSession` to reuse, so that
+        several checks share one connection pool. A temporary session is created
+        if not given
     :return: True if the user owns Minecraft, Raise AccountNotOwnMinecraft otherwise
     """
-    headers = {"Authorization": f"Bearer {access_token}"}
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await _have_minecraft(access_token, check, session)
+    return await _have_minecraft(access_token, check, session)
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            "https://api.minecraftservices.com/entitlements/mcstore", headers=headers
-        ) as resp:
-            resp.raise_for_status()
-            data = await resp.json()
-            if not data.get("items"):
-                raise AccountNotOwnMinecraft()
-            if check:
-                await verify_mojang_jwt(data.get("signature"))
-                for item in data.get("items", []):
-                    await verify_mojang_jwt(item["signature"])
-            return True
+
+async def _have_minecraft(
+    access_token: str, check: bool, session: aiohttp.ClientSession
+) -> bool:
+    headers = {"Authorization": f"Bearer {access_token}"}
+    async with session.get(
+        "https://api.minecraftservices.com/entitlements/mcstore", headers=headers
+    ) as resp:
+        resp.raise_for_status()
+        data = await resp.json()
+        if not data.get("items"):
+            raise AccountNotOwnMinecraft()
+        if check:
+            await verify_mojang_jwt(data.get("signature"))
+            for item in data.get("items", []):
+                await verify_mojang_jwt(item["signature"])
+        return True
 
 
 async def get_minecraft_profile(access_token: str) -> MinecraftProfileResponse:
@@ -1,8 +1,8 @@
 # 標準庫導入
 from typing import Literal
+import asyncio
 import platform
 import zipfile
-import json
 import os
 
 # 第三方庫導入
@@ -10,7 +10,7 @@ import aiofiles
 
 # 本地導入
 from ._internal_types.shared_types import ClientJson, ClientJsonLibrary
-from ._helper import parse_rule_list, inherit_json, get_library_path
+from ._helper import parse_rule_list, inherit_json, json_loads, get_library_path
 from .exceptions import VersionNotFound
 
 __all__ = ["extract_natives"]
@@ -46,6 +46,18 @@ async def extract_natives_file(
     """
     Unpack natives
     """
+    # 解壓和寫入文件都是阻塞操作，放到線程中執行以免阻塞事件循環
+    await asyncio.to_thread(
+        _extract_natives_file_sync, filename, extract_path, extract_data
+    )
+
+
+def _extract_natives_file_sync(
+    filename: str, extract_path: str, extract_data: dict[Literal["exclude"], list[str]]
+) -> None:
+    """
+    Unpack natives (blocking)
+    """
     try:
         os.mkdir(extract_path)
     except (IOError, OSError):
@@ -84,7 +96,7 @@ async def extract_natives(
         "r",
         encoding="utf-8",
     ) as f:
-        data: ClientJson = json.loads(await f.read())
+        data: ClientJson = json_loads(await f.read())
 
     if "inheritsFrom" in data:
         data = await inherit_json(data, path)
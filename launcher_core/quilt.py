@@ -12,6 +12,8 @@ import asyncio
 import tempfile
 import os
 
+import aiohttp
+
 from ._helper import (
     download_file,
     get_requests_response_cache,
@@ -25,7 +27,9 @@ from .install import install_minecraft_version
 from .utils import is_version_valid
 
 
-async def get_all_minecraft_versions() -> list[QuiltMinecraftVersion]:
+async def get_all_minecraft_versions(
+    session: aiohttp.ClientSession | None = None,
+) -> list[QuiltMinecraftVersion]:
     """
     Returns all available Minecraft Versions for Quilt
 
@@ -35,12 +39,18 @@ async def get_all_minecraft_versions() -> list[QuiltMinecraftVersion]:
 
         for version in await launcher_corequilt.get_all_minecraft_versions():
             print(version["version"])
+
+    :param session: An optional :class:`aiohttp.ClientSession` to reuse
     """
     quilt_minecraft_versions_url = "https://meta.quiltmc.org/v3/versions/game"
-    return await get_requests_response_cache(quilt_minecraft_versions_url)
+    return await get_requests_response_cache(
+        quilt_minecraft_versions_url, session=session
+    )
 
 
-async def get_stable_minecraft_versions() -> list[str]:
+async def get_stable_minecraft_versions(
+    session: aiohttp.ClientSession | None = None,
+) -> list[str]:
     """
     Returns a list which only contains the stable Minecraft versions that supports Quilt
 
@@ -50,8 +60,10 @@ async def get_stable_minecraft_versions() -> list[str]:
 
         for version in await launcher_corequilt.get_stable_minecraft_versions():
             print(version)
+
+    :param session: An optional :class:`aiohttp.ClientSession` to reuse
     """
-    minecraft_versions = await get_all_minecraft_versions()
+    minecraft_versions = await get_all_minecraft_versions(session=session)
     stable_versions = []
     for i in minecraft_versions:
         if i["stable"] is True:
@@ -59,7 +71,9 @@ async def get_stable_minecraft_versions() -> list[str]:
     return stable_versions
 
 
-async def get_latest_minecraft_version() -> str:
+async def get_latest_minecraft_version(
+    session: aiohttp.ClientSession | None = None,
+) -> str:
     """
     Returns the latest unstable Minecraft versions that supports Quilt. This could be a snapshot.
 
@@ -69,12 +83,16 @@ async def get_latest_minecraft_version() -> str:
 
         print("Latest Minecraft version: " +
             await launcher_corequilt.get_latest_minecraft_version())
+
+    :param session: An optional :class:`aiohttp.ClientSession` to reuse
     """
-    minecraft_versions = await get_all_minecraft_versions()
+    minecraft_versions = await get_all_minecraft_versions(session=session)
     return minecraft_versions[0]["version"]
 
 
-async def get_latest_stable_minecraft_version() -> str:
+async def get_latest_stable_minecraft_version(
+    session: aiohttp.ClientSession | None = None,
+) -> str:
     """
     Returns the latest stable Minecraft version that supports Quilt
 
@@ -84,12 +102,16 @@ async def get_latest_stable_minecraft_version() -> str:
 
         print("Latest stable Minecraft version: " +
             await launcher_corequilt.get_latest_stable_minecraft_version())
+
+    :param session: An optional :class:`aiohttp.ClientSession` to reuse
     """
-    stable_versions = await get_stable_minecraft_versions()
+    stable_versions = await get_stable_minecraft_versions(session=session)
     return stable_versions[0]
 
 
-async def is_minecraft_version_supported(version: str) -> bool:
+async def is_minecraft_version_supported(
+    version: str, session: aiohttp.ClientSession | None = None
+) -> bool:
     """
     Checks if a Minecraft version supported by Quilt
 
@@ -104,15 +126,18 @@ async def is_minecraft_version_supported(version: str) -> bool:
             print(f"{version} is not supported by quilt")
 
     :param version: A vanilla version
+    :param session: An optional :class:`aiohttp.ClientSession` to reuse
     """
-    minecraft_versions = await get_all_minecraft_versions()
+    minecraft_versions = await get_all_minecraft_versions(session=session)
     for i in minecraft_versions:
         if i["version"] == version:
             return True
     return False
 
 
-async def get_all_loader_versions() -> list[QuiltLoader]:
+async def get_all_loader_versions(
+    session: aiohttp.ClientSession | None = None,
+) -> list[QuiltLoader]:
     """
     Returns all loader versions
 
@@ -122,12 +147,16 @@ async def get_all_loader_versions() -> list[QuiltLoader]:
 
         for version in await launcher_corequilt.get_all_loader_versions():
             print(version["version"])
+
+    :param session: An optional :class:`aiohttp.ClientSession` to reuse
     """
     quilt_loader_versions_url = "https://meta.quiltmc.org/v3/versions/loader"
-    return await get_requests_response_cache(quilt_loader_versions_url)
+    return await get_requests_response_cache(quilt_loader_versions_url, session=session)
 
 
-async def get_latest_loader_version() -> str:
+async def get_latest_loader_version(
+    session: aiohttp.ClientSession | None = None,
+) -> str:
     """
     Get the latest loader version
 
@@ -137,8 +166,10 @@ async def get_latest_loader_version() -> str:
     .. code:: python
 
         print("Latest loader version: " + await launcher_corequilt.get_latest_loader_version())
+
+    :param session: An optional :class:`aiohttp.ClientSession` to reuse
     """
-    loader_versions = await get_all_loader_versions()
+    loader_versions = await get_all_loader_versions(session=session)
     return loader_versions[0]["version"]
 
 
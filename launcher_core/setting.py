@@ -1,4 +1,5 @@
 import logging
+import os
 
 
 def setup_logger(
@@ -24,15 +25,21 @@ def setup_logger(
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
+    # 重複呼叫時不重複添加處理器，避免同一條日誌輸出多次
+    has_console = any(type(h) is logging.StreamHandler for h in logger.handlers)
+    file_paths = {
+        h.baseFilename for h in logger.handlers if isinstance(h, logging.FileHandler)
+    }
+
     # 添加控制台處理器
-    if enable_console:
+    if enable_console and not has_console:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
         logger.addHandler(console_handler)
 
     # 添加文件處理器
-    if filename:
+    if filename and os.path.abspath(filename) not in file_paths:
         file_handler = logging.FileHandler(filename)
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
@@ -9,7 +9,6 @@ import pathlib
 import random
 import shutil
 import uuid
-import json
 import os
 from typing import Coroutine, Any
 import asyncio
@@ -17,7 +16,7 @@ import aiofiles
 from .logging_utils import logger
 from .models import MinecraftOptions, LatestMinecraftVersions, MinecraftVersionInfo
 from ._internal_types.shared_types import ClientJson, VersionListManifestJson
-from ._helper import get_requests_response_cache, assert_func
+from ._helper import get_requests_response_cache, assert_func, json_loads
 
 
 async def get_minecraft_directory() -> str:
@@ -69,7 +68,7 @@ async def get_latest_version() -> LatestMinecraftVersions:
         response = await get_requests_response_cache(
             "https://launchermeta.mojang.com/mc/game/version_manifest_v2.json"
         )
-        data = json.loads(response["content"])
+        data = json_loads(response["content"])
         latest = data["latest"]
         logger.info(
             f"最新版本 - Release: {latest['release']}, Snapshot: {latest['snapshot']}"
@@ -94,7 +93,10 @@ async def get_version_list() -> list[MinecraftVersionInfo]:
     response = await get_requests_response_cache(
         "https://launchermeta.mojang.com/mc/game/version_manifest_v2.json"
     )
-    vlist: VersionListManifestJson = response
+    vlist: VersionListManifestJson = response["json_data"]
+    if vlist is None:
+        # 伺服器未標示 JSON 內容類型時，自行解析原始內容
+        vlist = json_loads(response["content"])
     returnlist: list[MinecraftVersionInfo] = []
     for i in vlist["versions"]:
         returnlist.append(
@@ -143,7 +145,7 @@ async def get_installed_versions(
 
         try:
             async with aiofiles.open(json_path, "r", encoding="utf-8") as f:
-                version_data: ClientJson = json.loads(await f.read())
+                version_data: ClientJson = json_loads(await f.read())
 
             try:
                 release_time = datetime.fromisoformat(version_data["releaseTime"])
@@ -48,6 +48,36 @@ class TestConfigManager:
         assert config.launcher_name == "CustomLauncher"
         assert config.concurrent_downloads == 8
 
+    async def test_update_config_writes_through_by_default(self, temp_config_dir):
+        """Test updates are saved to disk unless deferred"""
+        config_path = Path(temp_config_dir) / "test_config.toml"
+        manager = ConfigManager(config_path)
+
+        await manager.update_config(launcher_name="CustomLauncher")
+
+        assert not manager.dirty
+        loaded_config = await ConfigManager(config_path).load_config()
+        assert loaded_config.launcher_name == "CustomLauncher"
+        assert os.listdir(temp_config_dir) == ["test_config.toml"]
+
+    async def test_update_config_defers_write_until_flush(self, temp_config_dir):
+        """Test deferred updates stay in memory until flush"""
+        config_path = Path(temp_config_dir) / "test_config.toml"
+        manager = ConfigManager(config_path)
+
+        await manager.update_config(flush=False, launcher_name="CustomLauncher")
+        await manager.update_config(flush=False, concurrent_downloads=8)
+
+        assert manager.dirty
+        assert not config_path.exists()
+
+        await manager.flush()
+
+        assert not manager.dirty
+        loaded_config = await ConfigManager(config_path).load_config()
+        assert loaded_config.launcher_name == "CustomLauncher"
+        assert loaded_config.concurrent_downloads == 8
+
     async def test_save_and_load_config(self, temp_config_dir):
         """Test saving and loading configuration"""
         config_path = Path(temp_config_dir) / "test_config.toml"
@@ -90,6 +120,25 @@ class TestConfigManager:
         assert config.verify_downloads is True
         assert config.log_level == "INFO"
 
+    def test_launcher_config_from_env(self):
+        """Test LauncherConfig.from_env reads prefixed and nested variables"""
+        environ = {
+            "MC_LAUNCHER_LAUNCHER_NAME": "EnvLauncher",
+            "MC_LAUNCHER_CONCURRENT_DOWNLOADS": "12",
+            "MC_LAUNCHER_JVM_ARGUMENTS": '["-Xmx2G"]',
+            "MC_LAUNCHER_MINECRAFT_OPTIONS__USERNAME": "EnvPlayer",
+            "MC_LAUNCHER_MINECRAFT_OPTIONS__GAMEDIRECTORY": "/games/mc",
+            "OTHER_VARIABLE": "ignored",
+        }
+        config = LauncherConfig.from_env(environ)
+
+        assert config.launcher_name == "EnvLauncher"
+        assert config.concurrent_downloads == 12
+        assert config.jvm_arguments == ["-Xmx2G"]
+        assert config.minecraft_options.username == "EnvPlayer"
+        assert config.minecraft_options.gameDirectory == "/games/mc"
+        assert config.log_level == "INFO"
+
 
 class TestVanillaProfile:
     """Test cases for vanilla profile management"""
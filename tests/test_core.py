@@ -1,11 +1,13 @@
 import pytest
 import sys
 import os
+from unittest.mock import AsyncMock, patch
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from launcher_core import exceptions
+from launcher_core import utils
 from launcher_core.utils import sync
 
 
@@ -39,6 +41,28 @@ class TestUtils:
         with pytest.raises(ValueError, match="Test error"):
             sync(async_function_with_error())
 
+    async def test_get_version_list_reads_cached_json(self):
+        """Test get_version_list reads the manifest from the cached response"""
+        manifest = {
+            "versions": [
+                {
+                    "id": "1.20.4",
+                    "type": "release",
+                    "releaseTime": "2023-12-07T12:56:20+00:00",
+                    "complianceLevel": 1,
+                }
+            ]
+        }
+        response = {"status": 200, "json_data": manifest, "content": b""}
+
+        with patch.object(
+            utils, "get_requests_response_cache", AsyncMock(return_value=response)
+        ):
+            versions = await utils.get_version_list()
+
+        assert [v["id"] for v in versions] == ["1.20.4"]
+        assert versions[0]["releaseTime"].year == 2023
+
 
 class TestExceptions:
     """Test cases for exceptions module"""
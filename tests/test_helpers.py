@@ -71,6 +71,63 @@ class TestHelperFunctions:
         # Results should be identical if caching works
         assert result1 == result2
 
+    @patch("launcher_core._helper.aiohttp.ClientSession")
+    async def test_get_requests_response_cache_reuses_session(self, mock_session):
+        """Test a caller-provided session is used instead of a new one"""
+        mock_response = Mock()
+        mock_response.read = AsyncMock(return_value=b"[]")
+        mock_response.text = AsyncMock(return_value="[]")
+        mock_response.json = AsyncMock(return_value=[])
+        mock_response.status = 200
+        mock_response.headers = {"Content-Type": "application/json"}
+
+        mock_get_ctx = AsyncMock()
+        mock_get_ctx.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_get_ctx.__aexit__ = AsyncMock(return_value=None)
+
+        shared_session = Mock()
+        shared_session.get = Mock(return_value=mock_get_ctx)
+
+        result = await _helper.get_requests_response_cache(
+            "https://api.example.com/shared-session", session=shared_session
+        )
+
+        assert result["json_data"] == []
+        shared_session.get.assert_called_once()
+        mock_session.assert_not_called()
+
+    async def test_download_file_bad_checksum_keeps_existing_file(self, tmp_path):
+        """Test a failed download never replaces the file at the target path"""
+
+        async def iter_chunked(size):
+            yield b"corrupted"
+
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.content.iter_chunked = iter_chunked
+
+        mock_get_ctx = AsyncMock()
+        mock_get_ctx.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_get_ctx.__aexit__ = AsyncMock(return_value=None)
+
+        session = Mock()
+        session.get = Mock(return_value=mock_get_ctx)
+
+        target = tmp_path / "client.jar"
+        target.write_bytes(b"original")
+
+        with pytest.raises(_helper.InvalidChecksum):
+            await _helper.download_file(
+                "https://example.com/client.jar",
+                str(target),
+                sha1="0" * 40,
+                session=session,
+            )
+
+        assert target.read_bytes() == b"original"
+        assert os.listdir(tmp_path) == ["client.jar"]
+
     def test_assert_func(self):
         """Test assertion helper function"""
         if hasattr(_helper, 'assert_func'):
@@ -81,6 +138,12 @@ class TestHelperFunctions:
             with pytest.raises(AssertionError):
                 _helper.assert_func(False)
 
+    def test_json_loads_without_orjson(self):
+        """Test JSON parsing falls back to the json module"""
+        with patch("launcher_core._helper.orjson", None):
+            assert _helper.json_loads('{"id": "1.20.4"}') == {"id": "1.20.4"}
+            assert _helper.json_loads(b'{"id": "1.20.4"}') == {"id": "1.20.4"}
+
     def test_parse_rule_list(self):
         """Test rule list parsing"""
         if hasattr(_helper, 'parse_rule_list'):
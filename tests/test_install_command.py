@@ -91,6 +91,75 @@ class TestInstall:
             assert result["id"] == "1.20.4"
             assert result["type"] == "release"
 
+    async def test_iter_version_list(self):
+        """Test iterating the version manifest entry by entry"""
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock()
+        mock_response.json = AsyncMock(
+            return_value={
+                "latest": {"release": "1.20.4", "snapshot": "24w07a"},
+                "versions": [
+                    {"id": "24w07a", "type": "snapshot"},
+                    {"id": "1.20.4", "type": "release"},
+                ],
+            }
+        )
+        mock_session_instance = Mock()
+        mock_session_instance.get = Mock(
+            return_value=AsyncContextManagerMock(mock_response)
+        )
+
+        with (
+            patch("launcher_core.install.ijson", None),
+            patch(
+                "aiohttp.ClientSession",
+                return_value=AsyncContextManagerMock(mock_session_instance),
+            ),
+        ):
+            ids = [v["id"] async for v in install.iter_version_list()]
+
+        assert ids == ["24w07a", "1.20.4"]
+        mock_session_instance.get.assert_called_once_with(install.VERSION_MANIFEST_URL)
+
+    async def test_install_libraries_shares_session(self, temp_minecraft_dir):
+        """Test libraries download concurrently through one session"""
+        libraries = [
+            {
+                "name": f"com.example:lib{i}:1.0",
+                "downloads": {
+                    "artifact": {
+                        "url": f"https://example.com/lib{i}.jar",
+                        "path": f"com/example/lib{i}/1.0/lib{i}-1.0.jar",
+                        "sha1": "0" * 40,
+                    }
+                },
+            }
+            for i in range(3)
+        ]
+        progress = []
+        session = Mock()
+
+        with (
+            patch(
+                "aiohttp.ClientSession", return_value=AsyncContextManagerMock(session)
+            ) as mock_session,
+            patch("launcher_core.install.download_file", AsyncMock()) as mock_download,
+        ):
+            await install.install_libraries(
+                "1.20.4",
+                libraries,
+                temp_minecraft_dir,
+                {"setProgress": progress.append},
+                max_workers=2,
+            )
+
+        mock_session.assert_called_once()
+        assert mock_download.await_count == 3
+        assert all(
+            call.kwargs["session"] is session for call in mock_download.await_args_list
+        )
+        assert progress == [1, 2, 3]
+
     async def test_install_minecraft_version(self, temp_minecraft_dir):
         """Test installing Minecraft version"""
         if hasattr(install, "install_minecraft_version"):
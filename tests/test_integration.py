@@ -1,6 +1,7 @@
 import pytest
 import sys
 import os
+from pathlib import Path
 from unittest.mock import patch, Mock, AsyncMock
 
 # Add the project root to Python path
@@ -30,6 +31,143 @@ class TestCustomClass:
             # Verify methods exist
             assert len(methods) >= 0
 
+    def test_launcher_config_model_expands_directories(self):
+        """Directory fields are expanded on assignment and resolved lazily"""
+        config = CustomClass.LauncherConfigModel(minecraft_directory="~/mc")
+        assert config.minecraft_directory == str(Path.home() / "mc")
+        assert config.minecraft_directory_resolved == str(
+            (Path.home() / "mc").resolve()
+        )
+        assert config.cache_directory is None
+        assert config.resolved_directory("cache_directory") is None
+
+        config.minecraft_directory = "~/other"
+        assert config.minecraft_directory_resolved == str(
+            (Path.home() / "other").resolve()
+        )
+
+    def test_sub_configs_are_frozen(self):
+        """Read-mostly sub-configs reject assignment; update_config copies them"""
+        from pydantic import ValidationError
+
+        launcher = CustomClass.MinecraftLauncher()
+        ui_config = launcher.config.ui_config
+        with pytest.raises(ValidationError):
+            ui_config.theme = "dark"
+
+        launcher.update_config(ui_config={"theme": "dark"})
+        assert launcher.config.ui_config.theme == "dark"
+        assert launcher.config.ui_config.window_width == ui_config.window_width
+        assert ui_config.theme == "auto"
+
+    def test_update_config_validates_sub_config_fields(self):
+        """update_config rejects out-of-range values and unknown keys"""
+        from pydantic import ValidationError
+
+        launcher = CustomClass.MinecraftLauncher()
+        with pytest.raises(ValidationError):
+            launcher.update_config(ui_config={"window_width": 10})
+        with pytest.raises(ValidationError):
+            launcher.update_config(ui_config={"bogus": 1})
+        assert launcher.config.ui_config.window_width >= 800
+
+    def test_complete_config_from_trusted_dict(self):
+        """Trusted loads rebuild nested models without validation"""
+        config = CustomClass.CompleteLauncherConfig()
+        config.add_profile(
+            CustomClass.GameProfileConfig(
+                profile_id="main", profile_name="Main", minecraft_version="1.20.1"
+            )
+        )
+
+        launcher = CustomClass.MinecraftLauncher()
+        launcher.load_config(config.model_dump(), trusted=True)
+
+        assert launcher.config == config
+        assert isinstance(
+            launcher.config.game_profiles["main"], CustomClass.GameProfileConfig
+        )
+        assert isinstance(launcher.config.ui_config, CustomClass.UIConfig)
+
+    def test_trusted_builder_compiled_once_per_model(self):
+        """Trusted loaders are compiled once and reused for each schema"""
+        model = CustomClass.CompleteLauncherConfig
+        builder = CustomClass._trusted_builder(model)
+        config = model()
+
+        assert CustomClass._trusted_builder(model) is builder
+        assert model.from_trusted_dict(config.model_dump()) == config
+
+    def test_bulk_edit_stamps_last_modified_once(self):
+        """bulk_edit defers last_modified until the block exits"""
+        import datetime
+
+        config = CustomClass.CompleteLauncherConfig()
+        before = datetime.datetime(2000, 1, 1)
+        config.last_modified = before
+
+        with config.bulk_edit():
+            for i in range(3):
+                config.add_profile(
+                    CustomClass.GameProfileConfig(
+                        profile_id=str(i),
+                        profile_name=str(i),
+                        minecraft_version="1.20.1",
+                    )
+                )
+            config.remove_profile("0")
+            assert config.last_modified == before
+
+        assert config.last_modified > before
+        assert sorted(config.game_profiles) == ["1", "2"]
+
+    async def test_multiple_checker_stops_at_first_invalid(self):
+        """MultipleChecker cancels pending checks once one credential fails"""
+        import asyncio
+        from launcher_core import Credential
+        from launcher_core.exceptions import AccountNotOwnMinecraft
+
+        CustomClass._OWNERSHIP_CACHE.clear()
+        cancelled = asyncio.Event()
+
+        async def fake_have_minecraft(token, session=None):
+            if token == "bad":
+                raise AccountNotOwnMinecraft()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        credentials = CustomClass.MultipleCredential(
+            AuthCredential=[
+                Credential(access_token="slow"),
+                Credential(access_token="bad"),
+            ]
+        )
+        with patch.object(CustomClass, "have_minecraft", fake_have_minecraft):
+            result = await asyncio.wait_for(
+                CustomClass.AccountManager.MultipleChecker(credentials), timeout=1
+            )
+
+        assert result is False
+        assert cancelled.is_set()
+
+    async def test_checker_caches_ownership_per_token(self):
+        """Checker reuses a recent have_minecraft result for the same token"""
+        from launcher_core import Credential
+
+        CustomClass._OWNERSHIP_CACHE.clear()
+        mock_have = AsyncMock(return_value=None)
+        credential = Credential(access_token="cached-token", expires_in=3600)
+
+        with patch.object(CustomClass, "have_minecraft", mock_have):
+            assert await CustomClass.AccountManager.Checker(credential) is True
+            assert await CustomClass.AccountManager.Checker(credential) is True
+
+        mock_have.assert_awaited_once_with("cached-token", session=None)
+        assert "cached-token" not in str(CustomClass._OWNERSHIP_CACHE)
+
 
 class TestSettings:
     """Test cases for settings module"""
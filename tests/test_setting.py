@@ -71,6 +71,25 @@ class TestSetting:
             assert logging.StreamHandler in handler_types
             assert logging.FileHandler in handler_types
 
+    def test_setup_logger_is_idempotent(self):
+        """Test repeated setup does not attach duplicate handlers"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = Path(temp_dir) / "test_repeat.log"
+
+            for _ in range(3):
+                logger = setting.setup_logger(
+                    "test_repeat_logger",
+                    logging.INFO,
+                    filename=str(log_file),
+                    enable_console=True
+                )
+
+            assert len(logger.handlers) == 2
+
+            for handler in logger.handlers[:]:
+                handler.close()
+                logger.removeHandler(handler)
+
     def test_setup_logger_default_parameters(self):
         """Test logger setup with default parameters"""
         logger = setting.setup_logger()